@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class CommonConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "common"
+
+    def ready(self):
+        from common.metrics import metrics
+        from common.models import Job
+
+        # 작업 종류별 대기 중인 작업 수
+        metrics.register_gauge("jobs.queue_depth", Job.objects.queue_depth)
@@ -0,0 +1,179 @@
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.db import DatabaseError
+from django.utils import timezone
+
+from common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def content_hash(text):
+    # 유니코드 정규화 + 공백 정리 후 해시 (새로고침/되돌리기 재전송 대응)
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    TTL 을 지원하는 스레드 안전 LRU 캐시 (프로세스 내부)
+    """
+
+    def __init__(self, name, maxsize, ttl):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        metrics.register_gauge(f"cache.{name}.size", self.__len__)
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING and item[0] <= now:
+                del self._data[key]
+                item = _MISSING
+            if item is _MISSING:
+                metrics.incr(f"cache.{self.name}.misses")
+                return default
+            self._data.move_to_end(key)
+        metrics.incr(f"cache.{self.name}.hits")
+        return item[1]
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        evicted = 0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                evicted += 1
+        if evicted:
+            metrics.incr(f"cache.{self.name}.evictions", evicted)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    프로세스 내부 LRU + DB 테이블(공유) 2단 캐시
+    model 은 common.models.CacheEntry 를 상속해야 함
+    """
+
+    def __init__(self, name, model, ttl, maxsize):
+        self.name = name
+        self.model = model
+        self.ttl = ttl
+        self.local = LRUCache(f"{name}.local", maxsize, ttl)
+
+    def get(self, key):
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return self.get_shared(key)
+
+    def get_shared(self, key):
+        # 로컬 캐시를 거치지 않고 공유(DB) 캐시를 조회 (다른 워커의 변경 확인용)
+        try:
+            entry = (
+                self.model.objects.filter(
+                    cache_key=key, expires_at__gt=timezone.now()
+                )
+                .values_list("value", "expires_at")
+                .first()
+            )
+        except DatabaseError as e:
+            # 공유 캐시 장애는 캐시 미스로 처리
+            logger.warning(f"Shared cache lookup failed ({self.name}): {e}")
+            entry = None
+
+        if entry is None:
+            metrics.incr(f"cache.{self.name}.shared.misses")
+            return None
+
+        value, expires_at = entry
+        metrics.incr(f"cache.{self.name}.shared.hits")
+        remaining = (expires_at - timezone.now()).total_seconds()
+        self.local.set(key, value, ttl=min(self.ttl, max(remaining, 0)))
+        return value
+
+    def get_many(self, keys):
+        # 여러 키를 로컬 캐시 + DB 쿼리 1회로 조회 (찾은 키만 반환)
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(key, _MISSING)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        if not missing:
+            return found
+
+        now = timezone.now()
+        try:
+            entries = list(
+                self.model.objects.filter(
+                    cache_key__in=missing, expires_at__gt=now
+                ).values_list("cache_key", "value", "expires_at")
+            )
+        except DatabaseError as e:
+            logger.warning(f"Shared cache lookup failed ({self.name}): {e}")
+            entries = []
+
+        for key, value, expires_at in entries:
+            remaining = (expires_at - now).total_seconds()
+            self.local.set(key, value, ttl=min(self.ttl, max(remaining, 0)))
+            found[key] = value
+        metrics.incr(f"cache.{self.name}.shared.hits", len(entries))
+        metrics.incr(
+            f"cache.{self.name}.shared.misses", len(missing) - len(entries)
+        )
+        return found
+
+    def set(self, key, value):
+        self.set_many({key: value})
+
+    def set_many(self, mapping):
+        if not mapping:
+            return
+        expires_at = timezone.now() + timedelta(seconds=self.ttl)
+        for key, value in mapping.items():
+            self.local.set(key, value)
+        try:
+            self.model.objects.bulk_create(
+                [
+                    self.model(
+                        cache_key=key, value=value, expires_at=expires_at
+                    )
+                    for key, value in mapping.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["cache_key"],
+                update_fields=["value", "expires_at"],
+            )
+        except DatabaseError as e:
+            logger.warning(f"Shared cache write failed ({self.name}): {e}")
+
+    def delete(self, key):
+        self.local.delete(key)
+        self.model.objects.filter(cache_key=key).delete()
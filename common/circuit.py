@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+
+from common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+# 게이지 값 (0: 정상, 1: 복구 확인 중, 2: 차단)
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """
+    회로가 열려 있거나 동시 호출 한도를 넘어 호출하지 않고 거부됨
+    """
+
+
+class CircuitBreaker:
+    """
+    외부 호출용 서킷 브레이커 + 동시 호출 제한(bulkhead), 프로세스 단위
+    - 연속 실패가 failure_threshold 에 도달하면 회로를 열고 즉시 거부
+    - recovery_timeout 이 지나면 half-open 상태에서 한 건만 시험 호출
+      성공하면 닫고, 실패하면 다시 연다
+    """
+
+    def __init__(
+        self, name, failure_threshold, recovery_timeout, max_concurrency
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._bulkhead = threading.BoundedSemaphore(max_concurrency)
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._in_flight = 0
+        metrics.register_gauge(
+            f"circuit.{name}.state", lambda: STATE_VALUES[self.state]
+        )
+        metrics.register_gauge(
+            f"circuit.{name}.in_flight", lambda: self._in_flight
+        )
+
+    @property
+    def state(self):
+        with self._lock:
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+                return HALF_OPEN
+            return self._state
+
+    def _before_call(self):
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    metrics.incr(f"circuit.{self.name}.rejected")
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN:
+                if self._probing:
+                    metrics.incr(f"circuit.{self.name}.rejected")
+                    raise CircuitOpenError(f"{self.name} circuit is half-open")
+                self._probing = True
+                return True
+            return False
+
+    def _on_success(self, probe):
+        with self._lock:
+            if probe:
+                self._probing = False
+                logger.info(f"Circuit {self.name} closed after probe")
+            self._state = CLOSED
+            self._failures = 0
+
+    def _on_rejected(self, probe):
+        # 호출 전에 거부된 경우(전체 한도 초과 등)는 실패로 세지 않음
+        if probe:
+            with self._lock:
+                self._probing = False
+
+    def _on_failure(self, probe):
+        with self._lock:
+            if probe:
+                self._probing = False
+            self._failures += 1
+            if probe or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    metrics.incr(f"circuit.{self.name}.opened")
+                    logger.warning(
+                        f"Circuit {self.name} opened after "
+                        f"{self._failures} failures"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        if not self._bulkhead.acquire(blocking=False):
+            metrics.incr(f"circuit.{self.name}.bulkhead_rejected")
+            raise CircuitOpenError(f"{self.name} concurrency limit reached")
+        try:
+            probe = self._before_call()
+            with self._lock:
+                self._in_flight += 1
+            try:
+                result = func(*args, **kwargs)
+            except CircuitOpenError:
+                self._on_rejected(probe)
+                raise
+            except Exception:
+                metrics.incr(f"circuit.{self.name}.failures")
+                self._on_failure(probe)
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+            self._on_success(probe)
+            return result
+        finally:
+            self._bulkhead.release()
@@ -0,0 +1,61 @@
+from django.utils.decorators import method_decorator
+from django.utils.timezone import localdate
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+
+def get_member_data_version(request):
+    """
+    (data_version, data_updated_at) 을 DB 에서 조회
+    인증 사용자 캐시는 다른 워커의 변경을 늦게 반영할 수 있으므로 항상 새로 읽음
+    """
+    if not hasattr(request, "_member_data_version"):
+        from member.models import SocialAccount
+
+        request._member_data_version = (
+            SocialAccount.objects.filter(pk=request.user.pk)
+            .values_list("data_version", "data_updated_at")
+            .first()
+        )
+    return request._member_data_version
+
+
+def member_data_etag(include_date=False):
+    def etag_func(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return None
+        version = get_member_data_version(request)
+        if version is None:
+            return None
+        etag = f"{request.user.social_account_id}-{version[0]}"
+        if include_date:
+            # 오늘 날짜 기준으로 계산되는 응답은 날짜가 바뀌면 달라짐
+            etag += f"-{localdate().isoformat()}"
+        return etag
+
+    return etag_func
+
+
+def member_data_last_modified(request, *args, **kwargs):
+    if not request.user.is_authenticated:
+        return None
+    version = get_member_data_version(request)
+    return version[1] if version else None
+
+
+def member_condition(include_date=False):
+    """
+    회원 데이터 버전 기반 조건부 GET (If-None-Match / If-Modified-Since)
+    APIView 의 get 메서드에 사용하며, 변경이 없으면 뷰 실행 없이 304 반환
+    """
+    return method_decorator(
+        [
+            cache_control(private=True, no_cache=True),
+            condition(
+                etag_func=member_data_etag(include_date),
+                last_modified_func=(
+                    None if include_date else member_data_last_modified
+                ),
+            ),
+        ]
+    )
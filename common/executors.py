@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+
+def _run_with_connections(fn, *args, **kwargs):
+    close_old_connections()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+class DBThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    작업 전후로 close_old_connections() 를 호출하는 스레드 풀 (map 포함)
+    오래 사는 풀 스레드가 DB 연결을 계속 붙잡거나, 끊긴 연결을 재사용하지 않도록 함
+    (요청 스레드의 request_started/finished 와 같은 역할)
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(_run_with_connections, fn, *args, **kwargs)
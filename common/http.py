@@ -0,0 +1,117 @@
+import logging
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 응답 코드 (일시적인 장애)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class UpstreamRetry(Retry):
+    """
+    Retry-After 가 HTTP_MAX_RETRY_AFTER 보다 길면 기다리지 않고 응답을 그대로 반환
+    (urllib3 는 Retry-After 만큼 상한 없이 sleep 하므로 요청 워커가 묶이지 않도록)
+    """
+
+    def increment(self, method=None, url=None, response=None, **kwargs):
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if (
+                retry_after is not None
+                and retry_after > settings.HTTP_MAX_RETRY_AFTER
+            ):
+                raise MaxRetryError(
+                    kwargs.get("_pool"),
+                    url,
+                    ResponseError(f"Retry-After {retry_after}s is too long"),
+                )
+        return super().increment(method, url, response=response, **kwargs)
+
+
+class UpstreamClient:
+    """
+    외부 서비스(upstream) 하나에 대한 HTTP 클라이언트
+    - 호스트별 keep-alive 연결 풀 재사용
+    - 기본 연결/응답 타임아웃
+    - 지터가 포함된 지수 백오프 재시도 (POST 는 연결 실패만 재시도)
+    - upstream 별 지연시간/오류 지표 기록
+    """
+
+    def __init__(self, name, timeout=None, retries=None):
+        self.name = name
+        self.timeout = timeout or (
+            settings.HTTP_CONNECT_TIMEOUT,
+            settings.HTTP_READ_TIMEOUT,
+        )
+        retries = settings.HTTP_MAX_RETRIES if retries is None else retries
+        retry = UpstreamRetry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            # 응답 읽기 실패/오류 응답 재시도는 멱등 메서드만 (POST 제외)
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            status_forcelist=RETRY_STATUS_CODES,
+            backoff_factor=settings.HTTP_RETRY_BACKOFF,
+            backoff_jitter=settings.HTTP_RETRY_BACKOFF,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        metrics.incr(f"http.{self.name}.requests")
+        try:
+            with metrics.timer(f"http.{self.name}.latency"):
+                response = self.session.request(method, url, **kwargs)
+        except requests.Timeout:
+            metrics.incr(f"http.{self.name}.timeouts")
+            raise
+        except requests.RequestException:
+            metrics.incr(f"http.{self.name}.errors")
+            raise
+
+        if response.status_code >= 400:
+            metrics.incr(
+                f"http.{self.name}.status_{response.status_code // 100}xx"
+            )
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+_lock = threading.Lock()
+_clients = {}
+
+
+def get_http_client(name, **options):
+    # upstream 이름별로 프로세스당 하나의 클라이언트(연결 풀)를 공유
+    # options(timeout, retries)는 처음 생성할 때만 적용
+    client = _clients.get(name)
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                client = UpstreamClient(name, **options)
+                _clients[name] = client
+    return client
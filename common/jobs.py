@@ -0,0 +1,130 @@
+import logging
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from common.metrics import metrics
+from common.models import Job
+from common.singleflight import advisory_lock_id
+
+logger = logging.getLogger(__name__)
+
+# job_type -> 처리 함수 (각 앱의 jobs 모듈에서 register_job 으로 등록)
+_handlers = {}
+# job_type -> 실행 주기(초), 주기 작업만
+_schedules = {}
+
+
+def register_job(job_type, every=None):
+    """
+    작업 처리 함수 등록 데코레이터, 처리 함수는 Job 인스턴스를 인자로 받음
+    예외가 발생하면 백오프 후 재시도하고, max_attempts 를 넘으면 실패로 남김
+    every(초)를 지정하면 주기 작업: 끝나면(최종 실패 포함) 같은 행을 다음 실행으로 예약
+    """
+
+    def decorator(func):
+        _handlers[job_type] = func
+        if every:
+            _schedules[job_type] = every
+        return func
+
+    return decorator
+
+
+def enqueue(job_type, payload=None, delay=0, max_attempts=None):
+    return Job.objects.create(
+        job_type=job_type,
+        payload=payload or {},
+        run_after=timezone.now() + timedelta(seconds=delay),
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+    )
+
+
+def schedule_recurring_jobs():
+    # 주기 작업마다 대기/실행 중인 작업이 없으면 등록 (워커 시작 시 호출)
+    for job_type in _schedules:
+        with transaction.atomic():
+            # 여러 워커가 동시에 시작해도 한 번만 등록되도록 직렬화
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(%s)",
+                    [advisory_lock_id("jobs", job_type)],
+                )
+            exists = Job.objects.filter(
+                job_type=job_type,
+                status__in=[Job.Status.PENDING, Job.Status.RUNNING],
+            ).exists()
+            if not exists:
+                enqueue(job_type)
+
+
+def reschedule(job):
+    # 주기 작업은 삭제하지 않고 다음 실행 시각으로 되돌림
+    job.status = Job.Status.PENDING
+    job.attempts = 0
+    job.run_after = timezone.now() + timedelta(seconds=_schedules[job.job_type])
+    job.locked_at = None
+    job.save(
+        update_fields=[
+            "status",
+            "attempts",
+            "run_after",
+            "locked_at",
+            "last_error",
+        ]
+    )
+
+
+def retry_delay(attempts):
+    # 지수 백오프 + 지터 (동시에 실패한 작업이 한꺼번에 재시도하지 않도록)
+    delay = settings.JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return delay * random.uniform(0.5, 1.5)
+
+
+def run_job(job):
+    close_old_connections()
+    handler = _handlers.get(job.job_type)
+    try:
+        with metrics.timer(f"jobs.{job.job_type}.latency"):
+            if handler is None:
+                raise LookupError(f"No handler registered for {job.job_type}")
+            handler(job)
+    except Exception as e:
+        fail_job(job, e)
+    else:
+        metrics.incr(f"jobs.{job.job_type}.succeeded")
+        if job.job_type in _schedules:
+            job.last_error = ""
+            reschedule(job)
+        else:
+            # 완료된 작업은 남기지 않음 (큐 테이블을 작게 유지)
+            Job.objects.filter(pk=job.pk).delete()
+    finally:
+        close_old_connections()
+
+
+def fail_job(job, error):
+    job.last_error = f"{type(error).__name__}: {error}"
+    job.locked_at = None
+    if job.attempts >= job.max_attempts:
+        metrics.incr(f"jobs.{job.job_type}.failed")
+        logger.error(
+            f"Job {job} failed after {job.attempts} attempts: {error}",
+            exc_info=error,
+        )
+        if job.job_type in _schedules:
+            # 주기 작업은 실패로 멈추지 않고 다음 주기에 다시 실행
+            reschedule(job)
+            return
+        job.status = Job.Status.FAILED
+    else:
+        job.status = Job.Status.PENDING
+        job.run_after = timezone.now() + timedelta(
+            seconds=retry_delay(job.attempts)
+        )
+        metrics.incr(f"jobs.{job.job_type}.retried")
+        logger.warning(f"Job {job} failed (attempt {job.attempts}): {error}")
+    job.save(update_fields=["status", "run_after", "locked_at", "last_error"])
@@ -0,0 +1,37 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from common.models import CacheEntry
+
+
+class Command(BaseCommand):
+    help = "Delete expired rows from every shared cache table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+
+        for model in apps.get_models():
+            if not issubclass(model, CacheEntry):
+                continue
+
+            deleted = 0
+            while True:
+                # 긴 락을 피하기 위해 배치 단위로 삭제
+                keys = list(
+                    model.objects.filter(expires_at__lte=now).values_list(
+                        "cache_key", flat=True
+                    )[:batch_size]
+                )
+                if not keys:
+                    break
+                count, _ = model.objects.filter(cache_key__in=keys).delete()
+                deleted += count
+
+            self.stdout.write(
+                f"{model._meta.label}: deleted {deleted} expired entries"
+            )
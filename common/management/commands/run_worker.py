@@ -0,0 +1,102 @@
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import autodiscover_modules
+
+from common.jobs import run_job, schedule_recurring_jobs
+from common.metrics import metrics
+from common.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs from the database queue. Start several "
+        "processes for more parallelism; no external broker is needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Number of worker threads in this process",
+        )
+        parser.add_argument(
+            "--type",
+            action="append",
+            dest="job_types",
+            help="Only run jobs of this type (repeatable, default: all)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--metrics-interval",
+            type=float,
+            default=60.0,
+            help="Seconds between job metric reports (0 to disable)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when no runnable jobs are left",
+        )
+
+    def handle(self, *args, **options):
+        # 각 앱의 jobs 모듈을 불러와 작업 처리 함수 등록
+        autodiscover_modules("jobs")
+        schedule_recurring_jobs()
+
+        concurrency = options["concurrency"]
+        reported_at = time.monotonic()
+        running = set()
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="job-worker"
+        ) as executor:
+            while True:
+                # 비어 있는 스레드 수만큼만 가져옴 (가져간 작업이 대기하지 않도록)
+                free = concurrency - len(running)
+                jobs = (
+                    Job.objects.claim(free, options["job_types"])
+                    if free
+                    else []
+                )
+                running.update(executor.submit(run_job, job) for job in jobs)
+                if not running:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                else:
+                    _, running = wait(
+                        running,
+                        timeout=options["poll_interval"],
+                        return_when=FIRST_COMPLETED,
+                    )
+
+                interval = options["metrics_interval"]
+                if interval and time.monotonic() - reported_at >= interval:
+                    self.report_metrics()
+                    reported_at = time.monotonic()
+        self.report_metrics()
+
+    def report_metrics(self):
+        snapshot = metrics.snapshot()
+        report = {
+            "queue_depth": Job.objects.queue_depth(),
+            "counters": {
+                name: value
+                for name, value in snapshot["counters"].items()
+                if name.startswith("jobs.")
+            },
+            "timers": {
+                name: value
+                for name, value in snapshot["timers"].items()
+                if name.startswith("jobs.")
+            },
+        }
+        self.stdout.write(json.dumps(report, ensure_ascii=False))
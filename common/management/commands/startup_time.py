@@ -0,0 +1,69 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 새 인터프리터에서 django.setup() 과 URLconf import 시간을 측정
+MEASURE_SCRIPT = """
+import importlib, json, time
+start = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+importlib.import_module({urlconf!r})
+urls_done = time.perf_counter()
+print(json.dumps({{
+    "setup_ms": (setup_done - start) * 1000,
+    "urls_ms": (urls_done - setup_done) * 1000,
+}}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Measure how long a fresh process takes to set up Django and import the URLconf."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--max-ms",
+            type=float,
+            help="Fail if the median total startup time exceeds this value",
+        )
+
+    def handle(self, *args, **options):
+        script = MEASURE_SCRIPT.format(urlconf=settings.ROOT_URLCONF)
+        env = dict(os.environ)
+        env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+        samples = []
+        for _ in range(options["repeat"]):
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                env=env,
+                cwd=settings.BASE_DIR,
+            )
+            if result.returncode != 0:
+                raise CommandError(
+                    f"Startup measurement failed:\n{result.stderr}"
+                )
+            samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+        setup_ms = statistics.median(s["setup_ms"] for s in samples)
+        urls_ms = statistics.median(s["urls_ms"] for s in samples)
+        total_ms = setup_ms + urls_ms
+        self.stdout.write(
+            f"django.setup(): {setup_ms:.1f}ms, "
+            f"import {settings.ROOT_URLCONF}: {urls_ms:.1f}ms, "
+            f"total: {total_ms:.1f}ms (median of {len(samples)})"
+        )
+
+        if options["max_ms"] is not None and total_ms > options["max_ms"]:
+            raise CommandError(
+                f"Startup time {total_ms:.1f}ms exceeds {options['max_ms']}ms"
+            )
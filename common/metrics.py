@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 카운터/게이지/타이머 저장소
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(int)
+        self._gauges = {}
+        self._timers = {}
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, name, value):
+        # 소요 시간(ms) 등 관측값의 개수/합계/최댓값 누적
+        with self._lock:
+            count, total, maximum = self._timers.get(name, (0, 0.0, 0.0))
+            self._timers[name] = (count + 1, total + value, max(maximum, value))
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1000)
+
+    def register_gauge(self, name, func):
+        # 조회 시점에 값을 계산하는 게이지 등록
+        with self._lock:
+            self._gauges[name] = func
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            timers = dict(self._timers)
+
+        gauge_values = {}
+        for name, func in gauges.items():
+            try:
+                gauge_values[name] = func()
+            except Exception as e:
+                gauge_values[name] = f"error: {str(e)}"
+
+        timer_values = {
+            name: {
+                "count": count,
+                "avg_ms": round(total / count, 2),
+                "max_ms": round(maximum, 2),
+            }
+            for name, (count, total, maximum) in timers.items()
+        }
+        return {
+            "counters": counters,
+            "gauges": gauge_values,
+            "timers": timer_values,
+        }
+
+
+metrics = MetricsRegistry()
+
+
+def estimated_row_count(model):
+    # 통계 기반 추정치(pg_class.reltuples) - COUNT(*) 전체 스캔 없이 테이블 크기 확인
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
@@ -0,0 +1,154 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+# 캐시 테이블 공통 필드 (TieredCache 의 공유 계층)
+class CacheEntry(models.Model):
+    cache_key = models.CharField(max_length=64, primary_key=True)
+    value = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return self.cache_key
+
+
+class JobManager(models.Manager):
+    def claim(self, limit, job_types=None):
+        """
+        실행할 작업을 가져와 실행 중으로 표시 (SELECT ... FOR UPDATE SKIP LOCKED)
+        여러 워커가 동시에 가져가도 같은 작업을 중복 실행하지 않음
+        JOB_STALE_AFTER 동안 갱신이 없는 실행 중 작업(워커 비정상 종료)도 다시 가져옴
+        """
+        now = timezone.now()
+        stale_before = now - timedelta(seconds=settings.JOB_STALE_AFTER)
+        with transaction.atomic():
+            queryset = self.select_for_update(skip_locked=True).filter(
+                Q(status=Job.Status.PENDING, run_after__lte=now)
+                | Q(status=Job.Status.RUNNING, locked_at__lt=stale_before)
+            )
+            if job_types:
+                queryset = queryset.filter(job_type__in=job_types)
+            jobs = list(queryset.order_by("run_after")[:limit])
+            for job in jobs:
+                job.status = Job.Status.RUNNING
+                job.attempts += 1
+                job.locked_at = now
+            self.bulk_update(jobs, ["status", "attempts", "locked_at"])
+        return jobs
+
+    def queue_depth(self):
+        # 작업 종류별 대기 중인 작업 수
+        return dict(
+            self.filter(status=Job.Status.PENDING)
+            .values("job_type")
+            .annotate(count=Count("id"))
+            .values_list("job_type", "count")
+        )
+
+
+# 백그라운드 작업 큐 (common.jobs 참고)
+class Job(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        FAILED = "failed"
+
+    job_type = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = JobManager()
+
+    class Meta:
+        indexes = [
+            # 완료된 작업은 삭제되고 실패한 작업만 남으므로 대기/실행 중만 인덱싱
+            models.Index(
+                fields=["status", "run_after"],
+                condition=Q(status__in=["pending", "running"]),
+                name="job_queue_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type} #{self.pk} ({self.status})"
+
+
+class RateLimitBucketManager(models.Manager):
+    def consume(self, bucket_key, capacity, refill_rate, cost=1):
+        """
+        토큰 버킷에서 cost 만큼 꺼냄 (쿼리 1회, 조회/충전/차감을 한 번에 처리)
+        버킷이 없으면 가득 찬 상태로 생성, 동시에 요청해도 행 잠금으로 직렬화됨
+        반환값: 다시 시도할 수 있을 때까지 기다려야 하는 초 (허용되면 0)
+        """
+        connection = connections[self.db]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        # 마지막 갱신 이후 흐른 시간만큼 채운 토큰 수 (최대 capacity)
+        available = (
+            "LEAST(%(capacity)s, bucket.tokens + EXTRACT(EPOCH FROM "
+            "statement_timestamp() - bucket.updated_at) * %(refill_rate)s)"
+        )
+        # 토큰이 부족하면 ON CONFLICT 의 WHERE 조건으로 행을 갱신하지 않음
+        # 본 쿼리는 갱신 전 스냅샷을 보므로 거부된 경우의 대기 시간 계산에 사용
+        sql = f"""
+            WITH consumed AS (
+                INSERT INTO {table} AS bucket (bucket_key, tokens, updated_at)
+                VALUES (
+                    %(bucket_key)s,
+                    %(capacity)s - %(cost)s,
+                    statement_timestamp()
+                )
+                ON CONFLICT (bucket_key) DO UPDATE SET
+                    tokens = {available} - %(cost)s,
+                    updated_at = statement_timestamp()
+                WHERE {available} >= %(cost)s
+                RETURNING 1
+            )
+            SELECT
+                EXISTS (SELECT 1 FROM consumed),
+                (
+                    SELECT {available} FROM {table} AS bucket
+                    WHERE bucket_key = %(bucket_key)s
+                )
+        """
+        params = {
+            "bucket_key": bucket_key,
+            "capacity": float(capacity),
+            "refill_rate": float(refill_rate),
+            "cost": float(cost),
+        }
+        with transaction.atomic(using=self.db):
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                allowed, available_tokens = cursor.fetchone()
+
+        if allowed:
+            return 0
+        return max(cost - (available_tokens or 0), 0) / refill_rate
+
+
+# 요청 한도용 토큰 버킷 (common.ratelimit 참고), 모든 워커가 공유
+class RateLimitBucket(models.Model):
+    bucket_key = models.CharField(max_length=200, primary_key=True)
+    tokens = models.FloatField()
+    updated_at = models.DateTimeField()
+
+    objects = RateLimitBucketManager()
+
+    def __str__(self):
+        return self.bucket_key
@@ -0,0 +1,100 @@
+import logging
+import math
+
+from django.db import DatabaseError
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from common.circuit import CircuitOpenError
+from common.metrics import metrics
+from common.models import RateLimitBucket
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+
+
+def parse_rate(rate):
+    # DRF 와 같은 형식: "횟수/기간" (기간: sec, min, hour, day)
+    num, period = rate.split("/")
+    return int(num), PERIODS[period[0]]
+
+
+class QuotaExceededError(CircuitOpenError):
+    """
+    외부 API 전체 사용량 한도를 넘어 호출하지 않고 거부됨
+    (회로 차단과 마찬가지로 재시도/분할 없이 빠르게 실패)
+    """
+
+    def __init__(self, name, wait):
+        super().__init__(f"{name} quota exceeded, retry in {math.ceil(wait)}s")
+        self.wait = wait
+
+
+class TokenBucket:
+    """
+    DB 기반 토큰 버킷, 모든 워커(프로세스)가 같은 버킷을 공유
+    rate: "횟수/기간" 형식, 최대 횟수만큼 연속 허용하고 기간 동안 그만큼 다시 채워짐
+    """
+
+    def __init__(self, name, rate):
+        self.name = name
+        self.capacity, period = parse_rate(rate)
+        self.refill_rate = self.capacity / period
+
+    def consume(self, key="", cost=1):
+        # 반환값: 다시 시도할 수 있을 때까지 기다려야 하는 초 (허용되면 0)
+        try:
+            wait = RateLimitBucket.objects.consume(
+                f"{self.name}:{key}",
+                self.capacity,
+                self.refill_rate,
+                min(cost, self.capacity),
+            )
+        except DatabaseError as e:
+            # DB 장애 시에는 한도 없이 진행 (요청 자체를 막지 않음)
+            logger.warning(f"Rate limit unavailable ({self.name}): {e}")
+            metrics.incr(f"ratelimit.{self.name}.errors")
+            return 0
+        if wait:
+            metrics.incr(f"ratelimit.{self.name}.limited")
+        return wait
+
+    def acquire(self, cost=1):
+        # 전체 한도용: 한도를 넘으면 QuotaExceededError 발생
+        wait = self.consume(cost=cost)
+        if wait:
+            raise QuotaExceededError(self.name, wait)
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    뷰의 throttle_scope 별 사용자 단위 토큰 버킷 (비로그인 요청은 IP 기준)
+    한도는 REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"][scope], scope 가 없는 뷰는 제한 없음
+    뷰에 get_throttle_cost(request) 가 있으면 그 값만큼 토큰 소모 (배치 요청 등)
+    한도를 넘으면 429 와 Retry-After 로 응답
+    """
+
+    _buckets = {}
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return True
+
+        bucket = self._buckets.get(scope)
+        if bucket is None:
+            bucket = self._buckets[scope] = TokenBucket(
+                f"user.{scope}", api_settings.DEFAULT_THROTTLE_RATES[scope]
+            )
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        get_cost = getattr(view, "get_throttle_cost", None)
+        cost = get_cost(request) if get_cost else 1
+        self.wait_seconds = bucket.consume(ident, cost)
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds
@@ -0,0 +1,108 @@
+import hashlib
+import logging
+import threading
+
+from django.db import DatabaseError, connection, transaction
+
+from common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def advisory_lock_id(name, key):
+    # PostgreSQL advisory lock 은 bigint 키를 사용
+    digest = hashlib.sha256(f"{name}:{key}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합침
+    - do(): 같은 프로세스의 스레드끼리 하나의 호출 결과(또는 예외)를 공유
+    - do_shared(): 추가로 PostgreSQL advisory lock 으로 워커(프로세스) 간 직렬화
+      락을 얻은 뒤 recheck() 로 공유 캐시를 다시 확인하고, 없을 때만 호출
+      (세션 단위 락이라 호출 중 func() 의 쿼리는 각각 바로 커밋됨)
+    """
+
+    def __init__(self, name, lock_timeout):
+        self.name = name
+        self.lock_timeout = lock_timeout
+        self._lock = threading.Lock()
+        self._calls = {}
+        metrics.register_gauge(
+            f"singleflight.{name}.in_flight", lambda: len(self._calls)
+        )
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.incr(f"singleflight.{self.name}.coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def do_shared(self, key, func, recheck):
+        return self.do(key, lambda: self._locked(key, func, recheck))
+
+    def _locked(self, key, func, recheck):
+        # 세션 단위 advisory lock 사용 (외부 호출 동안 트랜잭션을 열어 두지 않음)
+        # 결과를 캐시에 쓴 뒤 락을 풀므로, 대기하던 워커는 recheck() 로 결과를 확인함
+        lock_id = advisory_lock_id(self.name, key)
+        if not self._acquire(lock_id):
+            # 락 대기 시간 초과/DB 장애 시에는 조율 없이 진행
+            return func()
+        try:
+            value = recheck()
+            if value is not None:
+                metrics.incr(f"singleflight.{self.name}.shared_hits")
+                return value
+            return func()
+        finally:
+            self._release(lock_id)
+
+    def _acquire(self, lock_id):
+        try:
+            # lock_timeout 은 락을 얻는 짧은 트랜잭션에만 적용
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('lock_timeout', %s, true)",
+                    [f"{int(self.lock_timeout * 1000)}ms"],
+                )
+                cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+            return True
+        except DatabaseError as e:
+            logger.warning(f"Advisory lock failed ({self.name}): {e}")
+            metrics.incr(f"singleflight.{self.name}.lock_failures")
+            return False
+
+    def _release(self, lock_id):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+        except DatabaseError as e:
+            # 연결이 끊겼다면 세션 락도 함께 풀림
+            logger.warning(f"Advisory unlock failed ({self.name}): {e}")
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from common.views import MetricsView
+
+app_name = "common"
+
+urlpatterns = [
+    path("", MetricsView.as_view(), name="metrics"),
+]
@@ -0,0 +1,18 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        logger.info("GET request received for MetricsView")
+        return Response(metrics.snapshot(), status=status.HTTP_200_OK)
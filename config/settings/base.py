@@ -54,6 +54,7 @@ INSTALLED_APPS = [
     # own apps
     "member",
     "diary",
+    "common",
     "rest_framework",
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
@@ -66,6 +67,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 MIDDLEWARE = [
@@ -181,10 +183,84 @@ KAKAO_REDIRECT_URL = secrets["kakao"]["redirect_url"]
 
 YOUTUBE_API_KEY = secrets["youtube"]["api_key"]
 GOOGLE_API_KEY = secrets["google1"]["api_key"]
+
+# AI 분석 결과 캐시 설정 (TTL 단위: 초)
+MOOD_CACHE_TTL = 60 * 60 * 24 * 30
+MOOD_CACHE_MAXSIZE = 1024
+MUSIC_RECOMMENDATION_CACHE_TTL = 60 * 60 * 24 * 7
+MUSIC_RECOMMENDATION_CACHE_MAXSIZE = 512
+# 같은 조합에 대해 보관할 추천 결과 수 (다양성 유지)
+MUSIC_RECOMMENDATION_POOL_SIZE = 5
+
+# YouTube 검색 병렬 처리 설정 (타임아웃 단위: 초)
+YOUTUBE_LOOKUP_WORKERS = 6
+YOUTUBE_LOOKUP_TIMEOUT = 5
+
+# 곡 -> YouTube 영상 매핑 캐시 유효기간 (단위: 초)
+YOUTUBE_RESOLUTION_TTL = 60 * 60 * 24 * 30
+YOUTUBE_NEGATIVE_RESOLUTION_TTL = 60 * 60 * 24
+
+# 감정 분석 방식
+# llm: Gemini 만 사용, lexicon: 로컬 단어 사전 분류기만 사용
+# fallback: Gemini 실패 시 로컬 분류, prefilter: 로컬 분류 신뢰도가 높으면 Gemini 생략
+MOOD_CLASSIFIER_MODE = "llm"
+# prefilter 에서 LLM 을 생략하려면 단서 단어가 최소 MOOD_LEXICON_MIN_HITS 회 이상 나와야 함
+MOOD_LEXICON_CONFIDENCE = 0.8
+MOOD_LEXICON_MIN_HITS = 6
+
+# 감정 일괄 분석: 요청당 최대 항목 수, 프롬프트당 최대 일기 수/글자 수, 동시 요청 수
+MOOD_BATCH_MAX_REQUEST_ITEMS = 100
+MOOD_BATCH_MAX_ITEMS = 20
+MOOD_BATCH_MAX_CHARS = 12000
+MOOD_BATCH_WORKERS = 4
+
+# 백그라운드 작업(common.jobs): 기본 최대 시도 횟수, 재시도 기본 대기(초), 멈춘 작업 회수 기준(초)
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BACKOFF = 30
+JOB_STALE_AFTER = 60 * 10
+
+# 외부 HTTP 호출 공통 설정 (타임아웃/백오프 단위: 초)
+HTTP_CONNECT_TIMEOUT = 3
+HTTP_READ_TIMEOUT = 10
+HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.3
+# 이보다 긴 Retry-After 응답은 재시도하지 않고 호출한 쪽에 반환
+HTTP_MAX_RETRY_AFTER = 2
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+GEMINI_TIMEOUT = 30
+# Gemini 서킷 브레이커: 연속 실패 횟수, 차단 유지 시간(초), 동시 호출 한도
+GEMINI_CIRCUIT_FAILURE_THRESHOLD = 5
+GEMINI_CIRCUIT_RECOVERY_TIMEOUT = 30
+GEMINI_MAX_CONCURRENCY = 8
+# 동일한 LLM 요청을 다른 워커가 처리 중일 때 기다리는 최대 시간 (단위: 초)
+LLM_COALESCE_LOCK_TIMEOUT = GEMINI_TIMEOUT + 5
+# 외부 API 전체 호출 한도 (모든 사용자/워커 공유, 형식: "횟수/기간")
+# YouTube 검색은 1회 100 유닛, 기본 일일 할당량은 10,000 유닛
+GEMINI_RATE_LIMIT = "600/min"
+YOUTUBE_RATE_LIMIT = "100/day"
+
+# 인증 사용자(계정 + 회원정보) 캐시 설정 (TTL 단위: 초)
+AUTH_USER_CACHE_TTL = 60
+AUTH_USER_CACHE_MAXSIZE = 4096
+
+# 만료된 리프레시 토큰/블랙리스트 정리 주기 (작업 큐의 주기 작업, 단위: 초)
+TOKEN_PRUNE_INTERVAL = 60 * 60
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "member.authentication.CachedJWTAuthentication",
     ],
+    # throttle_scope 가 지정된 뷰만 사용자별로 제한 (토큰 버킷)
+    "DEFAULT_THROTTLE_CLASSES": [
+        "common.ratelimit.TokenBucketThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "mood": "30/min",
+        # 일괄 분석은 항목 수만큼 소모 (분당 최대 한 요청 분량)
+        "mood_batch": "100/min",
+        "music": "10/min",
+    },
 }
 
 APPEND_SLASH = True
@@ -211,4 +287,5 @@ CORS_ALLOWED_HEADERS = [
     "x-requested-with",
 ]
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ["etag", "last-modified"]
 CSRF_TRUSTED_ORIGINS = ["https://www.feelody.site"]
@@ -21,6 +21,7 @@ INSTALLED_APPS = [
     # own apps
     "member",
     "diary",
+    "common",
     "rest_framework",
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
@@ -32,6 +33,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 ROOT_URLCONF = "config.urls.prod_urls"
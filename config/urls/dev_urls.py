@@ -31,6 +31,7 @@ urlpatterns = [
     path("api/diary/", include("diary.urls.diary_urls")),
     path("api/diary/recommendation-keyword/", include("diary.urls.ai_urls")),
     path("api/diary/music/", include("diary.urls.music_urls")),
+    path("api/metrics/", include("common.urls")),
     path(
         "api/swagger/",
         schema_view.with_ui("swagger", cache_timeout=0),
@@ -9,4 +9,5 @@ urlpatterns = [
     path("api/diary/", include("diary.urls.diary_urls")),
     path("api/diary/recommendation-keyword/", include("diary.urls.ai_urls")),
     path("api/diary/music/", include("diary.urls.music_urls")),
+    path("api/metrics/", include("common.urls")),
 ]
@@ -0,0 +1,36 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from member.authentication import invalidate_cached_user
+from member.models import MemberInfo, SocialAccount
+
+
+@pytest.fixture
+def account(db):
+    social_account = SocialAccount.objects.create_user(
+        email="member@example.com",
+        provider="kakao",
+        provider_user_id="1234",
+        profile_image="https://example.com/profile.png",
+        is_active=True,
+    )
+    MemberInfo.objects.create(
+        social_account=social_account,
+        nickname="member",
+        introduce="hello",
+        favorite_genre=["pop"],
+    )
+    # 인증 캐시가 비어 있는 상태에서 시작
+    invalidate_cached_user(social_account.social_account_id)
+    return social_account
+
+
+@pytest.fixture
+def client(account):
+    # 인증된 API 클라이언트
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(account)}"
+    )
+    return client
@@ -0,0 +1,30 @@
+import hashlib
+
+from django.conf import settings
+
+from common.cache import TieredCache
+from diary.models import MoodAnalysisCache, MusicRecommendationCache
+
+mood_cache = TieredCache(
+    "mood",
+    MoodAnalysisCache,
+    ttl=settings.MOOD_CACHE_TTL,
+    maxsize=settings.MOOD_CACHE_MAXSIZE,
+)
+
+recommendation_cache = TieredCache(
+    "recommendation",
+    MusicRecommendationCache,
+    ttl=settings.MUSIC_RECOMMENDATION_CACHE_TTL,
+    maxsize=settings.MUSIC_RECOMMENDATION_CACHE_MAXSIZE,
+)
+
+
+def recommendation_key(moods, favorite_genre):
+    # 감정/장르 순서와 무관하게 같은 키가 나오도록 정렬
+    if isinstance(favorite_genre, str):
+        favorite_genre = [favorite_genre]
+    genres = sorted({genre.strip() for genre in favorite_genre or []})
+    canonical = ",".join(sorted({mood.strip() for mood in moods}))
+    canonical += "|" + ",".join(genres)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
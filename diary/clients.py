@@ -0,0 +1,88 @@
+import logging
+import threading
+
+from django.conf import settings
+
+from common.circuit import CircuitBreaker
+from common.http import get_http_client
+from common.metrics import metrics
+from common.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+GEMINI_MODEL_NAME = "gemini-2.0-flash"
+YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+
+# 외부 API 클라이언트는 최초 사용 시점에 한 번만 생성 (워커 부팅 시간 단축)
+_lock = threading.Lock()
+_genai = None
+
+# Gemini 장애 시 워커가 타임아웃까지 묶이지 않도록 빠르게 실패
+gemini_breaker = CircuitBreaker(
+    "gemini",
+    failure_threshold=settings.GEMINI_CIRCUIT_FAILURE_THRESHOLD,
+    recovery_timeout=settings.GEMINI_CIRCUIT_RECOVERY_TIMEOUT,
+    max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+)
+
+# 외부 API 전체 사용량 한도 (한 사용자가 할당량을 모두 소진하지 않도록)
+gemini_quota = TokenBucket("gemini", settings.GEMINI_RATE_LIMIT)
+youtube_quota = TokenBucket("youtube", settings.YOUTUBE_RATE_LIMIT)
+
+
+def get_gemini_model(model_name=GEMINI_MODEL_NAME):
+    global _genai
+    if _genai is None:
+        with _lock:
+            if _genai is None:
+                import google.generativeai as genai
+
+                genai.configure(api_key=settings.GOOGLE_API_KEY)
+                _genai = genai
+                logger.info("Gemini client configured")
+    return _genai.GenerativeModel(model_name)
+
+
+def generate_content(prompt, model_name=GEMINI_MODEL_NAME):
+    # 타임아웃을 지정하고 호출 지연시간/오류를 지표로 기록
+    # 회로가 열려 있으면 호출하지 않고 CircuitOpenError 발생
+    # 전체 호출 한도를 넘으면 QuotaExceededError (CircuitOpenError 의 하위 클래스)
+    # 회로가 열려 있을 때는 한도를 소모하지 않도록 회로 확인 후 토큰 획득
+    return gemini_breaker.call(_generate_content, prompt, model_name)
+
+
+def _generate_content(prompt, model_name):
+    gemini_quota.acquire()
+    metrics.incr("http.gemini.requests")
+    try:
+        with metrics.timer("http.gemini.latency"):
+            return get_gemini_model(model_name).generate_content(
+                prompt, request_options={"timeout": settings.GEMINI_TIMEOUT}
+            )
+    except Exception:
+        metrics.incr("http.gemini.errors")
+        raise
+
+
+def search_youtube(query, max_results=1):
+    # YouTube Data API(REST) 검색 - 공용 HTTP 클라이언트(연결 풀) 사용
+    # 전체 호출 한도를 넘으면 QuotaExceededError
+    # 요청이 기다리지 않고 포기한 조회가 재시도로 풀 스레드를 오래 점유하지 않도록
+    # 재시도 없이 한 번만 호출
+    youtube_quota.acquire()
+    response = get_http_client("youtube", retries=0).get(
+        YOUTUBE_SEARCH_URL,
+        params={
+            "key": settings.YOUTUBE_API_KEY,
+            "q": query,
+            "part": "snippet",
+            "type": "video",
+            "maxResults": max_results,
+        },
+        timeout=(
+            settings.HTTP_CONNECT_TIMEOUT,
+            settings.YOUTUBE_LOOKUP_TIMEOUT,
+        ),
+    )
+    response.raise_for_status()
+    return response.json()
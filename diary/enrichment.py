@@ -0,0 +1,111 @@
+import logging
+
+from django.db import transaction
+
+from common.jobs import enqueue
+from diary.models import DailyMoodCount, Diary, DiaryEnrichment
+from diary.mood_analysis import analyze_moods_batch
+from member.models import SocialAccount
+
+logger = logging.getLogger(__name__)
+
+ENRICH_JOB = "diary.enrich"
+
+
+def recommend_track(moods, favorite_genre):
+    # 추천 곡 중 YouTube 영상을 찾은 첫 곡 (없으면 None)
+    from diary.views.ai_views import recommend_music
+    from diary.views.music_views import get_youtube_infos
+
+    recommendations = recommend_music(moods, favorite_genre)
+    for info in get_youtube_infos(recommendations):
+        if "error" not in info:
+            return info
+    return None
+
+
+def fill_moods(diary, moods):
+    # 그 사이 사용자가 감정을 입력했다면 덮어쓰지 않음
+    with transaction.atomic():
+        updated = Diary.objects.filter(pk=diary.pk, moods=[]).update(
+            moods=moods
+        )
+        if updated:
+            diary.moods = moods
+            DailyMoodCount.objects.add_diary(diary)
+            SocialAccount.objects.bump_data_version(diary.member_id)
+    return bool(updated)
+
+
+def fill_rec_music(diary, rec_music):
+    with transaction.atomic():
+        updated = Diary.objects.filter(
+            pk=diary.pk, rec_music__isnull=True
+        ).update(rec_music=rec_music)
+        if updated:
+            diary.rec_music = rec_music
+            SocialAccount.objects.bump_data_version(diary.member_id)
+    return bool(updated)
+
+
+def enqueue_enrichment(diary):
+    # 작업 상태를 대기로 두고 백그라운드 작업 등록 (호출하는 쪽의 트랜잭션과 함께 커밋)
+    enrichment, _ = DiaryEnrichment.objects.update_or_create(
+        diary=diary,
+        defaults={"status": DiaryEnrichment.Status.PENDING, "last_error": ""},
+    )
+    enqueue(ENRICH_JOB, {"diary_id": str(diary.diary_id)})
+    return enrichment
+
+
+def enrich_diaries(diary_ids):
+    """
+    일기의 빈 감정(moods)과 추천 음악(rec_music)을 채움
+    감정은 일괄 분석으로 한 번에 요청
+    반환값: 실패한 일기의 {diary_id: 오류 메시지}
+    """
+    diaries = list(
+        Diary.objects.filter(diary_id__in=diary_ids)
+        .select_related("member__member_info")
+        .only(
+            "diary_id",
+            "member_id",
+            "date",
+            "content",
+            "moods",
+            "rec_music",
+            "member__member_info__favorite_genre",
+        )
+    )
+    errors = {}
+
+    need_moods = [diary for diary in diaries if not diary.moods]
+    if need_moods:
+        results, mood_errors = analyze_moods_batch(
+            [(str(diary.diary_id), diary.content) for diary in need_moods]
+        )
+        for diary in need_moods:
+            key = str(diary.diary_id)
+            if key in results:
+                fill_moods(diary, results[key])
+            else:
+                errors[diary.diary_id] = mood_errors.get(key, "")
+
+    for diary in diaries:
+        if diary.diary_id in errors or diary.rec_music is not None:
+            continue
+        member_info = getattr(diary.member, "member_info", None)
+        favorite_genre = member_info.favorite_genre if member_info else []
+        try:
+            rec_music = recommend_track(diary.moods, favorite_genre or [])
+        except Exception as e:
+            logger.warning(
+                f"Music enrichment failed for diary {diary.diary_id}: {e}"
+            )
+            errors[diary.diary_id] = f"Music recommendation failed: {e}"
+            continue
+        if rec_music is None:
+            errors[diary.diary_id] = "No playable recommendation found"
+            continue
+        fill_rec_music(diary, rec_music)
+    return errors
@@ -0,0 +1,45 @@
+from django.utils import timezone
+
+from common.jobs import register_job
+from diary.enrichment import ENRICH_JOB, enrich_diaries
+from diary.models import DailyMoodCount, DiaryEnrichment
+
+
+@register_job(ENRICH_JOB)
+def enrich_diary(job):
+    # 실패하면 예외를 발생시켜 작업 큐의 재시도(백오프)에 맡김
+    diary_id = job.payload["diary_id"]
+    enrichments = DiaryEnrichment.objects.filter(diary_id=diary_id)
+    enrichments.update(
+        status=DiaryEnrichment.Status.RUNNING,
+        attempts=job.attempts,
+        updated_at=timezone.now(),
+    )
+
+    errors = enrich_diaries([diary_id])
+    if not errors:
+        enrichments.update(
+            status=DiaryEnrichment.Status.DONE,
+            last_error="",
+            updated_at=timezone.now(),
+        )
+        return
+
+    error = next(iter(errors.values()))
+    final = job.attempts >= job.max_attempts
+    enrichments.update(
+        status=(
+            DiaryEnrichment.Status.FAILED
+            if final
+            else DiaryEnrichment.Status.PENDING
+        ),
+        last_error=error,
+        updated_at=timezone.now(),
+    )
+    raise RuntimeError(error)
+
+
+@register_job("diary.rebuild_mood_rollup")
+def rebuild_mood_rollup(job):
+    # payload: {"member_ids": [...]} (없으면 전체 재계산)
+    DailyMoodCount.objects.rebuild(job.payload.get("member_ids"))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from diary.models import DailyMoodCount
+
+
+class Command(BaseCommand):
+    help = "Compare the daily mood rollup table with diaries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--member",
+            action="append",
+            dest="members",
+            help="social_account_id to check (repeatable, default: all)",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the rollup for members with mismatches",
+        )
+
+    def handle(self, *args, **options):
+        mismatches = DailyMoodCount.objects.inconsistencies(options["members"])
+        for member_id, date, mood, expected, actual in mismatches:
+            self.stdout.write(
+                f"{member_id} {date} {mood}: expected {expected}, got {actual}"
+            )
+
+        if not mismatches:
+            self.stdout.write("Daily mood rollup is consistent")
+            return
+
+        members = sorted({str(row[0]) for row in mismatches})
+        if options["fix"]:
+            DailyMoodCount.objects.rebuild(members)
+            self.stdout.write(f"Rebuilt rollup for {len(members)} members")
+        else:
+            raise CommandError(
+                f"{len(mismatches)} mismatched rows for {len(members)} members"
+            )
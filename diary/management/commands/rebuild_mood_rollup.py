@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from diary.models import DailyMoodCount
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily mood rollup table from diaries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--member",
+            action="append",
+            dest="members",
+            help="social_account_id to rebuild (repeatable, default: all)",
+        )
+
+    def handle(self, *args, **options):
+        rows = DailyMoodCount.objects.rebuild(options["members"])
+        self.stdout.write(f"Rebuilt daily mood rollup: {rows} rows")
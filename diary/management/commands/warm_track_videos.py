@@ -0,0 +1,93 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from diary.models import Diary, TrackVideo, track_key
+from diary.views.music_views import fetch_youtube_video
+
+
+class Command(BaseCommand):
+    help = (
+        "Warm the track -> YouTube video table from a 'title - artist' list "
+        "file and/or from music already saved in diaries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "file",
+            nargs="?",
+            help="Text file with one 'title - artist' per line",
+        )
+        parser.add_argument(
+            "--from-diaries",
+            action="store_true",
+            help="Seed from rec_music saved in diaries (no YouTube calls)",
+        )
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            help="Resolve again even if a fresh entry exists",
+        )
+
+    def handle(self, *args, **options):
+        if not options["file"] and not options["from_diaries"]:
+            raise CommandError("Provide a track list file or --from-diaries.")
+
+        if options["from_diaries"]:
+            self.seed_from_diaries()
+        if options["file"]:
+            self.resolve_file(options["file"], options["refresh"])
+
+    def seed_from_diaries(self):
+        entries = []
+        rec_musics = Diary.objects.exclude(rec_music=None).values_list(
+            "rec_music", flat=True
+        )
+        for rec_music in rec_musics.iterator(chunk_size=1000):
+            tracks = rec_music if isinstance(rec_music, list) else [rec_music]
+            for track in tracks:
+                if not isinstance(track, dict):
+                    continue
+                if not all(
+                    track.get(k) for k in ("title", "artist", "video_id")
+                ):
+                    continue
+                entries.append(
+                    TrackVideo.for_track(
+                        track["title"],
+                        track["artist"],
+                        video_id=track["video_id"],
+                        thumbnail=track.get("thumbnail", ""),
+                    )
+                )
+
+        TrackVideo.objects.store_many(entries)
+        self.stdout.write(f"Seeded {len(entries)} tracks from diaries")
+
+    def resolve_file(self, path, refresh):
+        with open(path, encoding="utf-8") as f:
+            tracks = []
+            for line in f:
+                if " - " not in line:
+                    continue
+                title, artist = line.split(" - ", 1)
+                tracks.append((title.strip(), artist.strip()))
+
+        fresh = {} if refresh else TrackVideo.objects.lookup_many(tracks)
+        resolved, failed = 0, 0
+        for title, artist in tracks:
+            if track_key(title, artist) in fresh:
+                continue
+            try:
+                video = fetch_youtube_video(title, artist)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"Failed to resolve {title} - {artist}: {e}")
+                continue
+            TrackVideo.objects.store_many(
+                [TrackVideo.for_track(title, artist, **(video or {}))]
+            )
+            resolved += 1
+
+        self.stdout.write(
+            f"Resolved {resolved} tracks, skipped {len(tracks) - resolved - failed}"
+            f" fresh, {failed} failed"
+        )
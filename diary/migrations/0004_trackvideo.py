@@ -0,0 +1,44 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0003_moodanalysiscache"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrackVideo",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title_key", models.CharField(max_length=255)),
+                ("artist_key", models.CharField(max_length=255)),
+                (
+                    "video_id",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                ("thumbnail", models.URLField(blank=True)),
+                ("resolved_at", models.DateTimeField(auto_now=True)),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("title_key", "artist_key"),
+                        name="unique_track_video",
+                    )
+                ],
+            },
+        ),
+    ]
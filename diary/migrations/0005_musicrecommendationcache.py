@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0004_trackvideo"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MusicRecommendationCache",
+            fields=[
+                (
+                    "cache_key",
+                    models.CharField(
+                        max_length=64, primary_key=True, serialize=False
+                    ),
+                ),
+                ("value", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
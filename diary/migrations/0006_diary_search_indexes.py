@@ -0,0 +1,49 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0005_musicrecommendationcache"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="diary",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "diary_title", "content", config="simple"
+                ),
+                name="diary_search_vector_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="diary",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("diary_title"),
+                    name="gin_trgm_ops",
+                ),
+                name="diary_title_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="diary",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("content"),
+                    name="gin_trgm_ops",
+                ),
+                name="diary_content_trgm_idx",
+            ),
+        ),
+    ]
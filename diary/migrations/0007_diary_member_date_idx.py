@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0006_diary_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="diary",
+            index=models.Index(
+                fields=["member", "date"], name="diary_member_date_idx"
+            ),
+        ),
+    ]
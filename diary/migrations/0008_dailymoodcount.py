@@ -0,0 +1,60 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0007_diary_member_date_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyMoodCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("mood", models.CharField(max_length=20)),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "member",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_mood_counts",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("member", "date", "mood"),
+                        name="unique_daily_mood_count",
+                    )
+                ],
+            },
+        ),
+        # 기존 일기로 집계 초기값 채우기
+        migrations.RunSQL(
+            """
+            INSERT INTO diary_dailymoodcount (member_id, date, mood, count)
+            SELECT d.member_id, d.date, m.mood, COUNT(*)
+            FROM diary_diary AS d
+            CROSS JOIN LATERAL unnest(d.moods) AS m(mood)
+            GROUP BY d.member_id, d.date, m.mood
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:13
+
+from collections import Counter
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_diaries(apps, schema_editor):
+    """
+    제약 조건 추가 전, 같은 날짜에 여러 개인 일기는 가장 최근 것만 남기고 삭제
+    (기존 사전 확인이 동시 요청에서 중복을 막지 못했음)
+    삭제한 일기의 감정은 (회원, 날짜) 감정 집계에서도 다시 계산
+    """
+    Diary = apps.get_model("diary", "Diary")
+    DailyMoodCount = apps.get_model("diary", "DailyMoodCount")
+    duplicates = (
+        Diary.objects.values("member_id", "date")
+        .annotate(diary_count=Count("diary_id"))
+        .filter(diary_count__gt=1)
+        .values_list("member_id", "date")
+    )
+    for member_id, date in list(duplicates):
+        diaries = list(
+            Diary.objects.filter(member_id=member_id, date=date).order_by(
+                "-created_at", "-diary_id"
+            )
+        )
+        kept = diaries[0]
+        Diary.objects.filter(
+            diary_id__in=[diary.diary_id for diary in diaries[1:]]
+        ).delete()
+
+        DailyMoodCount.objects.filter(member_id=member_id, date=date).delete()
+        DailyMoodCount.objects.bulk_create(
+            DailyMoodCount(member_id=member_id, date=date, mood=mood, count=n)
+            for mood, n in Counter(kept.moods).items()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0008_dailymoodcount"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_diaries, migrations.RunPython.noop
+        ),
+        migrations.RemoveIndex(
+            model_name="diary",
+            name="diary_member_date_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="diary",
+            constraint=models.UniqueConstraint(
+                fields=("member", "date"), name="unique_diary_per_member_date"
+            ),
+        ),
+    ]
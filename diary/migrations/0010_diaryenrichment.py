@@ -0,0 +1,62 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:29
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diary", "0009_unique_diary_per_member_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DiaryEnrichment",
+            fields=[
+                (
+                    "diary",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="enrichment",
+                        serialize=False,
+                        to="diary.diary",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "run_after",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(
+                            ("status__in", ["pending", "running"])
+                        ),
+                        fields=["status", "run_after"],
+                        name="diary_enrichment_queue_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:30
+
+from django.db import migrations
+
+
+def enqueue_pending_enrichments(apps, schema_editor):
+    # 기존 대기/실행 중인 작업을 공용 작업 큐로 옮김
+    DiaryEnrichment = apps.get_model("diary", "DiaryEnrichment")
+    Job = apps.get_model("common", "Job")
+    Job.objects.bulk_create(
+        Job(job_type="diary.enrich", payload={"diary_id": str(diary_id)})
+        for diary_id in DiaryEnrichment.objects.filter(
+            status__in=["pending", "running"]
+        ).values_list("diary_id", flat=True)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_job"),
+        ("diary", "0010_diaryenrichment"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            enqueue_pending_enrichments, migrations.RunPython.noop
+        ),
+        migrations.RemoveIndex(
+            model_name="diaryenrichment",
+            name="diary_enrichment_queue_idx",
+        ),
+        migrations.RemoveField(
+            model_name="diaryenrichment",
+            name="run_after",
+        ),
+    ]
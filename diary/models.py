@@ -1,10 +1,19 @@
+import unicodedata
 import uuid
+from datetime import timedelta
 
+from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
-from django.db.models import JSONField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import connection, models, transaction
+from django.db.models import DateField, JSONField, Q, Sum
+from django.db.models.functions import Trunc, Upper
 from django.utils import timezone
 
+from common.models import CacheEntry
+from common.singleflight import advisory_lock_id
+from diary.search import diary_search_vector
+
 
 def get_today_date():
     return timezone.now().date()
@@ -25,5 +34,325 @@ class Diary(models.Model):
     date = models.DateField(default=get_today_date)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            # 하루에 하나의 일기만 작성 가능 ((member, date) 조회 인덱스 겸용)
+            models.UniqueConstraint(
+                fields=["member", "date"], name="unique_diary_per_member_date"
+            ),
+        ]
+        indexes = [
+            # 검색용 인덱스 (diary.search 참고)
+            GinIndex(diary_search_vector(), name="diary_search_vector_idx"),
+            GinIndex(
+                OpClass(Upper("diary_title"), name="gin_trgm_ops"),
+                name="diary_title_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("content"), name="gin_trgm_ops"),
+                name="diary_content_trgm_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.diary_title
+
+
+class DailyMoodCountManager(models.Manager):
+    def _lock_member(self, cursor, member_id):
+        # 같은 회원의 집계 증감/재계산을 직렬화 (트랜잭션이 끝나면 해제)
+        lock_id = advisory_lock_id("mood_rollup", uuid.UUID(str(member_id)))
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_id])
+
+    def _apply(self, member_id, date, moods, delta):
+        # 일기 하나의 감정을 (회원, 날짜, 감정) 집계에 더하거나 뺌
+        if not moods:
+            return
+        table = self.model._meta.db_table
+        with connection.cursor() as cursor:
+            self._lock_member(cursor, member_id)
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (member_id, date, mood, count)
+                SELECT %s, %s, m.mood, COUNT(*) * %s
+                FROM unnest(%s::varchar[]) AS m(mood)
+                GROUP BY m.mood
+                ON CONFLICT (member_id, date, mood)
+                DO UPDATE SET count = {table}.count + EXCLUDED.count
+                """,
+                [member_id, date, delta, list(moods)],
+            )
+            cursor.execute(
+                f"DELETE FROM {table} "
+                "WHERE member_id = %s AND date = %s AND count <= 0",
+                [member_id, date],
+            )
+
+    def add_diary(self, diary):
+        self._apply(diary.member_id, diary.date, diary.moods, 1)
+
+    def remove_diary(self, diary):
+        self._apply(diary.member_id, diary.date, diary.moods, -1)
+
+    def mood_counts(self, member_id, start_date, end_date):
+        """
+        집계 테이블에서 기간 내 감정별 횟수 조회 ({감정: 횟수})
+        """
+        rows = (
+            self.filter(
+                member_id=member_id, date__gte=start_date, date__lte=end_date
+            )
+            .values("mood")
+            .annotate(mood_count=Sum("count"))
+            .order_by("-mood_count", "mood")
+            .values_list("mood", "mood_count")
+        )
+        return dict(rows)
+
+    def bucketed_counts(self, member_id, start_date, end_date, bucket):
+        """
+        date_trunc(bucket) 단위 감정별 합계를 한 번의 쿼리로 조회
+        [(구간 시작일, 감정, 횟수), ...]
+        """
+        return (
+            self.filter(
+                member_id=member_id, date__gte=start_date, date__lte=end_date
+            )
+            .annotate(
+                bucket_start=Trunc("date", bucket, output_field=DateField())
+            )
+            .values("bucket_start", "mood")
+            .annotate(mood_count=Sum("count"))
+            .order_by("bucket_start", "mood")
+            .values_list("bucket_start", "mood", "mood_count")
+        )
+
+    def rebuild(self, member_ids=None):
+        """
+        일기 테이블 기준으로 집계를 다시 계산 (member_ids 가 없으면 전체)
+        회원별 짧은 트랜잭션으로 나눠 다른 회원의 일기 쓰기를 막지 않음
+        """
+        if member_ids is None:
+            member_ids = Diary.objects.values_list(
+                "member_id", flat=True
+            ).union(self.values_list("member_id", flat=True))
+        return sum(self._rebuild_member(m) for m in member_ids)
+
+    def _rebuild_member(self, member_id):
+        table = self.model._meta.db_table
+        diary_table = Diary._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            # 재계산 중 들어오는 같은 회원의 증감분이 유실되지 않도록 대기시킴
+            self._lock_member(cursor, member_id)
+            cursor.execute(
+                f"DELETE FROM {table} WHERE member_id = %s", [member_id]
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (member_id, date, mood, count)
+                SELECT d.member_id, d.date, m.mood, COUNT(*)
+                FROM {diary_table} AS d
+                CROSS JOIN LATERAL unnest(d.moods) AS m(mood)
+                WHERE d.member_id = %s
+                GROUP BY d.member_id, d.date, m.mood
+                """,
+                [member_id],
+            )
+            return cursor.rowcount
+
+    def inconsistencies(self, member_ids=None):
+        """
+        일기 테이블 기준 값과 집계 값이 다른 행 목록
+        (member_id, date, mood, 기대값, 집계값)
+        """
+        table = self.model._meta.db_table
+        diary_table = Diary._meta.db_table
+        params = (
+            [] if member_ids is None else [[str(m) for m in member_ids]] * 2
+        )
+        diary_filter = (
+            "" if member_ids is None else "WHERE d.member_id = ANY(%s::uuid[])"
+        )
+        rollup_filter = (
+            "" if member_ids is None else "WHERE member_id = ANY(%s::uuid[])"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH expected AS (
+                    SELECT d.member_id, d.date, m.mood, COUNT(*) AS count
+                    FROM {diary_table} AS d
+                    CROSS JOIN LATERAL unnest(d.moods) AS m(mood)
+                    {diary_filter}
+                    GROUP BY d.member_id, d.date, m.mood
+                ), actual AS (
+                    SELECT member_id, date, mood, count
+                    FROM {table}
+                    {rollup_filter}
+                )
+                SELECT
+                    COALESCE(e.member_id, a.member_id),
+                    COALESCE(e.date, a.date),
+                    COALESCE(e.mood, a.mood),
+                    COALESCE(e.count, 0),
+                    COALESCE(a.count, 0)
+                FROM expected AS e
+                FULL OUTER JOIN actual AS a
+                    ON e.member_id = a.member_id
+                    AND e.date = a.date
+                    AND e.mood = a.mood
+                WHERE COALESCE(e.count, 0) <> COALESCE(a.count, 0)
+                """,
+                params,
+            )
+            return cursor.fetchall()
+
+
+# 회원/날짜/감정별 집계 테이블 (통계 조회용)
+class DailyMoodCount(models.Model):
+    member = models.ForeignKey(
+        "member.SocialAccount",
+        on_delete=models.CASCADE,
+        related_name="daily_mood_counts",
+    )
+    date = models.DateField()
+    mood = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    objects = DailyMoodCountManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["member", "date", "mood"],
+                name="unique_daily_mood_count",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.member_id} {self.date} {self.mood}: {self.count}"
+
+
+# 감정 분석 결과 캐시 (일기 내용 해시 -> 감정 목록)
+class MoodAnalysisCache(CacheEntry):
+    pass
+
+
+# 음악 추천 결과 캐시 (감정 조합 + 장르 -> 추천 결과 풀)
+class MusicRecommendationCache(CacheEntry):
+    pass
+
+
+def normalize_track_text(value):
+    # 대소문자, 전각/반각, 공백 차이를 무시한 검색 키
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+
+def track_key(title, artist):
+    return normalize_track_text(title)[:255], normalize_track_text(artist)[:255]
+
+
+class TrackVideoManager(models.Manager):
+    def lookup_many(self, tracks):
+        """
+        (title, artist) 목록 중 만료되지 않은 항목을 한 번의 쿼리로 조회
+        """
+        keys = {track_key(title, artist) for title, artist in tracks}
+        if not keys:
+            return {}
+
+        condition = Q()
+        for title_key, artist_key in keys:
+            condition |= Q(title_key=title_key, artist_key=artist_key)
+        entries = self.filter(condition, expires_at__gt=timezone.now())
+        return {(entry.title_key, entry.artist_key): entry for entry in entries}
+
+    def lookup(self, title, artist):
+        return self.lookup_many([(title, artist)]).get(track_key(title, artist))
+
+    def store_many(self, entries):
+        # 같은 키가 중복되면 ON CONFLICT 가 실패하므로 마지막 값만 사용
+        entries = list(
+            {
+                (entry.title_key, entry.artist_key): entry for entry in entries
+            }.values()
+        )
+        now = timezone.now()
+        for entry in entries:
+            # 검색 결과 없음은 짧게 캐시 (네거티브 캐시)
+            ttl = (
+                settings.YOUTUBE_RESOLUTION_TTL
+                if entry.video_id
+                else settings.YOUTUBE_NEGATIVE_RESOLUTION_TTL
+            )
+            entry.expires_at = now + timedelta(seconds=ttl)
+
+        return self.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["title_key", "artist_key"],
+            update_fields=[
+                "video_id",
+                "thumbnail",
+                "resolved_at",
+                "expires_at",
+            ],
+        )
+
+
+# 곡(제목/가수) -> YouTube 영상 매핑 캐시
+class TrackVideo(models.Model):
+    title_key = models.CharField(max_length=255)
+    artist_key = models.CharField(max_length=255)
+    video_id = models.CharField(max_length=20, null=True, blank=True)
+    thumbnail = models.URLField(blank=True)
+    resolved_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    objects = TrackVideoManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title_key", "artist_key"], name="unique_track_video"
+            )
+        ]
+
+    @classmethod
+    def for_track(cls, title, artist, video_id=None, thumbnail=""):
+        title_key, artist_key = track_key(title, artist)
+        return cls(
+            title_key=title_key,
+            artist_key=artist_key,
+            video_id=video_id,
+            thumbnail=thumbnail,
+        )
+
+    def __str__(self):
+        return f"{self.title_key} - {self.artist_key}"
+
+
+# 일기 작성 후 감정/추천 음악을 백그라운드에서 채우는 작업 상태 (diary.jobs 참고)
+class DiaryEnrichment(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    diary = models.OneToOneField(
+        Diary,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="enrichment",
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.diary_id} ({self.status})"
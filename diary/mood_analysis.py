@@ -0,0 +1,180 @@
+import logging
+import re
+
+from django.conf import settings
+
+from common.cache import content_hash
+from common.circuit import CircuitOpenError
+from common.executors import DBThreadPoolExecutor
+from common.metrics import metrics
+from diary.cache import mood_cache
+from diary.clients import generate_content
+from diary.moods import MOOD_CHOICES
+
+logger = logging.getLogger(__name__)
+
+# 응답 한 줄: "<번호>: 감정1, 감정2, ..." (번호는 대괄호로 감싸져 있을 수 있음)
+RESULT_LINE = re.compile(r"^\s*\[?([^\]:]+?)\]?\s*:\s*(.+?)\s*$")
+UNANALYZABLE = "분석불가"
+
+batch_executor = DBThreadPoolExecutor(
+    max_workers=settings.MOOD_BATCH_WORKERS,
+    thread_name_prefix="mood-batch",
+)
+
+
+def build_batch_prompt(contents):
+    # 토큰 절약을 위해 묶음 안에서는 1부터 시작하는 번호로 구분
+    entries = "\n\n".join(
+        f"[{number}]\n{content}"
+        for number, content in enumerate(contents, start=1)
+    )
+    return f"""
+    다음은 여러 사용자가 작성한 일기입니다. 각 일기는 [번호] 로 시작합니다.
+
+    {entries}
+
+    각 일기마다 감정을 정확히 네가지 고르세요.
+    반드시 아래 감정 목록에 있는 감정만 선택하세요.
+
+    [감정 목록]
+    {", ".join(MOOD_CHOICES)}
+
+    일기마다 한 줄씩, 아래 형식으로만 출력하고 다른 문장은 절대로 출력하지 마세요.
+    번호: 감정1, 감정2, 감정3, 감정4
+
+    출력 예시:
+    1: 기쁨, 설렘, 행복, 감사
+
+    일기의 내용이 비정상적이라면 해당 번호에 {UNANALYZABLE}를 출력하세요.
+    """
+
+
+def parse_batch_response(text, count):
+    """
+    반환값: ({번호: 감정 목록}, {번호: 오류 메시지}), 번호는 1부터 시작
+    응답에 없거나 형식이 맞지 않는 번호는 둘 다에 없음
+    """
+    results = {}
+    errors = {}
+    for line in text.splitlines():
+        match = RESULT_LINE.match(line)
+        if not match or not match.group(1).strip().isdigit():
+            continue
+        number = int(match.group(1))
+        if not 1 <= number <= count:
+            continue
+        body = match.group(2)
+        if UNANALYZABLE in body:
+            errors[number] = (
+                "Emotion keywords could not be extracted from the diary."
+            )
+            continue
+        moods = [
+            mood.strip()
+            for mood in body.split(",")
+            if mood.strip() in MOOD_CHOICES
+        ]
+        if len(moods) >= 2:
+            results[number] = moods
+    return results, errors
+
+
+def pack_batches(items, max_items, max_chars):
+    # 항목 수/글자 수 한도 안에서 순서대로 묶음
+    batches = []
+    batch = []
+    size = 0
+    for item in items:
+        length = len(item[1])
+        if batch and (len(batch) >= max_items or size + length > max_chars):
+            batches.append(batch)
+            batch = []
+            size = 0
+        batch.append(item)
+        size += length
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def analyze_batch(items):
+    """
+    묶음 하나를 분석, 실패하거나 응답에서 빠진 항목은 반으로 나눠 다시 요청
+    반환값: ({id: 감정 목록}, {id: 오류 메시지})
+    """
+    try:
+        metrics.incr("mood_batch.prompts")
+        response = generate_content(
+            build_batch_prompt([content for _, content in items])
+        )
+        text = response.text.strip() if response else ""
+        by_number, errors_by_number = parse_batch_response(text, len(items))
+        results = {items[n - 1][0]: moods for n, moods in by_number.items()}
+        errors = {items[n - 1][0]: msg for n, msg in errors_by_number.items()}
+    except CircuitOpenError as e:
+        # 회로가 열려 있으면 나눠서 재시도하지 않음
+        return {}, {item_id: str(e) for item_id, _ in items}
+    except Exception as e:
+        if len(items) == 1:
+            logger.warning(f"Batch mood analysis failed: {str(e)}")
+            return {}, {items[0][0]: f"Error during emotion analysis: {e}"}
+        logger.warning(f"Batch of {len(items)} failed, splitting: {str(e)}")
+        results, errors = {}, {}
+
+    remaining = [item for item in items if item[0] not in results | errors]
+    if remaining and len(items) == 1:
+        errors[items[0][0]] = "No valid response received from the model."
+    elif remaining:
+        metrics.incr("mood_batch.splits")
+        middle = (len(remaining) + 1) // 2
+        for part in (remaining[:middle], remaining[middle:]):
+            if part:
+                part_results, part_errors = analyze_batch(part)
+                results.update(part_results)
+                errors.update(part_errors)
+    return results, errors
+
+
+def analyze_moods_batch(items):
+    """
+    여러 일기의 감정을 한 번에 분석
+    items: [(id, 내용), ...]
+    반환값: ({id: 감정 목록}, {id: 오류 메시지})
+    - 같은 내용은 한 번만 분석하고, 캐시된 결과는 LLM 호출 없이 사용
+    - 묶음(프롬프트)들은 스레드 풀에서 동시에 요청
+    """
+    hashes = {item_id: content_hash(content) for item_id, content in items}
+    cached = mood_cache.get_many(set(hashes.values()))
+
+    # 내용(해시)별로 한 번만 요청
+    pending = {}
+    for item_id, content in items:
+        key = hashes[item_id]
+        if key not in cached and key not in pending:
+            pending[key] = content
+
+    batches = pack_batches(
+        list(pending.items()),
+        settings.MOOD_BATCH_MAX_ITEMS,
+        settings.MOOD_BATCH_MAX_CHARS,
+    )
+    analyzed, failed = {}, {}
+    for results, errors in batch_executor.map(analyze_batch, batches):
+        analyzed.update(results)
+        failed.update(errors)
+    mood_cache.set_many(analyzed)
+
+    metrics.incr("mood_batch.items", len(items))
+    # 캐시 또는 중복 내용으로 LLM 요청을 생략한 항목 수
+    metrics.incr("mood_batch.skipped", len(items) - len(pending))
+
+    results, errors = {}, {}
+    for item_id, _ in items:
+        key = hashes[item_id]
+        moods = cached.get(key) or analyzed.get(key)
+        if moods:
+            results[item_id] = moods
+        else:
+            errors[item_id] = failed.get(key, "Failed to analyze emotions.")
+    return results, errors
@@ -0,0 +1,97 @@
+import numpy as np
+
+# 감정 분석 시 선택 가능한 감정 목록 (LLM 프롬프트와 동일)
+MOOD_CHOICES = [
+    "기쁨", "슬픔", "분노", "불안", "사랑", "두려움", "외로움", "설렘", "짜증", "행복",
+    "후회", "자신감", "좌절", "공포", "흥분", "우울", "희망", "질투", "원망", "감동",
+    "미움", "초조", "만족", "실망", "그리움", "죄책감", "충격", "안도", "긴장", "감사",
+]  # fmt: skip
+
+# 단서가 없을 때 사용하는 기본 감정
+DEFAULT_MOODS = ["안도", "희망"]
+
+# 감정별 단서 단어 (LLM 을 사용할 수 없을 때의 간이 분류용)
+MOOD_LEXICON = {
+    "기쁨": ["기쁘", "기뻤", "신나", "신났", "즐거", "즐겁", "웃었", "웃음"],
+    "슬픔": ["슬프", "슬펐", "눈물", "울었", "울고", "서러"],
+    "분노": ["화가", "화났", "화나", "열받", "분노", "빡치"],
+    "불안": ["불안", "걱정", "조마조마", "찝찝"],
+    "사랑": ["사랑", "좋아해", "애인", "연인", "데이트"],
+    "두려움": ["두렵", "두려", "무섭", "무서"],
+    "외로움": ["외로", "외롭", "혼자", "쓸쓸"],
+    "설렘": ["설레", "설렜", "두근"],
+    "짜증": ["짜증", "귀찮", "지겹", "지긋지긋"],
+    "행복": ["행복", "좋았", "좋은 하루", "최고"],
+    "후회": ["후회", "괜히", "했어야"],
+    "자신감": ["자신감", "자신 있", "해냈", "할 수 있"],
+    "좌절": ["좌절", "포기", "떨어졌", "망했"],
+    "공포": ["공포", "소름", "끔찍"],
+    "흥분": ["흥분", "짜릿", "신기"],
+    "우울": ["우울", "무기력", "의욕이 없", "울적"],
+    "희망": ["희망", "기대", "꿈", "내일은"],
+    "질투": ["질투", "부럽", "부러"],
+    "원망": ["원망", "탓"],
+    "감동": ["감동", "뭉클", "벅차"],
+    "미움": ["미워", "밉", "싫어", "싫다"],
+    "초조": ["초조", "조급", "마감"],
+    "만족": ["만족", "뿌듯", "흡족"],
+    "실망": ["실망", "아쉽", "아쉬웠"],
+    "그리움": ["그립", "그리워", "보고 싶", "보고싶"],
+    "죄책감": ["죄책감", "미안", "잘못했"],
+    "충격": ["충격", "놀랐", "황당", "어이없"],
+    "안도": ["안도", "다행", "안심"],
+    "긴장": ["긴장", "떨렸", "떨려", "면접", "시험"],
+    "감사": ["감사", "고마", "고맙"],
+}
+
+
+class LexiconMoodClassifier:
+    """
+    감정별 단서 단어 사전으로 일기를 채점하는 로컬 분류기 (네트워크 불필요)
+    - 단서 단어 출현 횟수 벡터(단어 수) x 가중치 행렬(단어 수 x 감정 수) = 감정 점수
+    - confidence: 상위 감정 점수 합 / (전체 점수 합 + 1)
+      단서가 적거나 여러 감정에 흩어져 있으면 낮아짐
+    - 단서 출현 횟수 합이 min_hits 미만이면 감정 없이 confidence 0
+    """
+
+    def __init__(self, lexicon, moods=MOOD_CHOICES):
+        self.moods = list(moods)
+        keywords = sorted({kw for kws in lexicon.values() for kw in kws})
+        self.keywords = np.array(keywords)
+        self.weights = np.zeros((len(keywords), len(self.moods)))
+        index = {keyword: i for i, keyword in enumerate(keywords)}
+        for mood, kws in lexicon.items():
+            for keyword in kws:
+                self.weights[index[keyword], self.moods.index(mood)] = 1.0
+
+    def scores(self, content):
+        counts = np.char.count(content, self.keywords)
+        return counts @ self.weights
+
+    def classify(self, content, limit=4, min_hits=1):
+        # 반환값: (점수가 높은 순 감정 목록, confidence)
+        scores = self.scores(content)
+        if scores.sum() < min_hits:
+            return [], 0.0
+        # 점수 내림차순, 동점이면 MOOD_CHOICES 순서 (안정 정렬)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        order = order[scores[order] > 0]
+        confidence = scores[order].sum() / (scores.sum() + 1)
+        return [self.moods[i] for i in order], float(confidence)
+
+
+lexicon_classifier = LexiconMoodClassifier(MOOD_LEXICON)
+
+
+def guess_moods(content, limit=4):
+    """
+    단서 단어로 감정을 추정 (LLM 대체용)
+    추정된 감정이 2개 미만이면 DEFAULT_MOODS 로 채움
+    """
+    moods, _ = lexicon_classifier.classify(content, limit)
+    for mood in DEFAULT_MOODS:
+        if len(moods) >= 2:
+            break
+        if mood not in moods:
+            moods.append(mood)
+    return moods
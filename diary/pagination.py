@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class DiarySearchPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    ordering = ("-created_at", "-diary_id")
+
+    # sort 파라미터별 정렬 기준 (첫 번째 필드가 커서 위치로 사용됨)
+    orderings = {
+        "recent": ("-created_at", "-diary_id"),
+        "relevance": ("-rank", "-created_at", "-diary_id"),
+    }
+
+    def __init__(self, sort="relevance"):
+        self.ordering = self.orderings[sort]
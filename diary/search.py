@@ -0,0 +1,65 @@
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Cast, Greatest, Lower, StrIndex, Substr
+
+# 한국어는 형태소 분석 사전이 없으므로 simple 설정 + 트라이그램 부분일치를 함께 사용
+SEARCH_CONFIG = "simple"
+SNIPPET_BEFORE = 40
+SNIPPET_LENGTH = 120
+
+
+def diary_search_vector():
+    # diary.models.Diary 의 GIN 표현식 인덱스와 동일한 식이어야 인덱스를 사용함
+    return SearchVector("diary_title", "content", config=SEARCH_CONFIG)
+
+
+def search_diaries(queryset, q):
+    """
+    전문 검색 + 부분일치로 필터링하고 관련도(rank)와 요약문(snippet)을 계산
+    정렬은 호출하는 쪽(커서 페이지네이션)에서 지정
+    """
+    query = SearchQuery(q, config=SEARCH_CONFIG, search_type="websearch")
+    match_position = StrIndex(Lower("content"), Lower(Value(q)))
+    return (
+        queryset.alias(search=diary_search_vector())
+        .filter(
+            Q(search=query)
+            | Q(diary_title__icontains=q)
+            | Q(content__icontains=q)
+        )
+        .annotate(
+            # real -> double 변환: 커서 페이지네이션에서 값 비교가 정확하도록
+            rank=Cast(
+                SearchRank(F("search"), query)
+                + TrigramWordSimilarity(q, "diary_title")
+                + TrigramWordSimilarity(q, "content"),
+                FloatField(),
+            ),
+            snippet=Substr(
+                "content",
+                Greatest(match_position - SNIPPET_BEFORE, 1),
+                SNIPPET_LENGTH,
+            ),
+        )
+    )
+
+
+def highlight_spans(text, q):
+    # 검색어(및 공백으로 나눈 각 단어)가 나타나는 [시작, 끝) 위치 목록
+    terms = {q.strip(), *q.split()}
+    pattern = "|".join(
+        re.escape(term) for term in sorted(terms, key=len, reverse=True) if term
+    )
+    if not pattern or not text:
+        return []
+    return [
+        [match.start(), match.end()]
+        for match in re.finditer(pattern, text, flags=re.IGNORECASE)
+    ]
@@ -1,8 +1,12 @@
 import datetime
 
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 from diary.models import Diary
+from diary.search import highlight_spans
 from member.models import MemberInfo
 
 
@@ -28,7 +32,6 @@ class DiarySerializer(serializers.ModelSerializer):
         read_only_fields = ["diary_id", "member", "created_at"]
 
     def validate(self, data):
-        request = self.context.get("request")
         today = datetime.date.today()
 
         # 원본 요청 데이터에서 가져오기!!
@@ -64,14 +67,24 @@ class DiarySerializer(serializers.ModelSerializer):
                 "You cannot write a diary for a future date."
             )
 
-        # 중복 일기 방지 (하루 한개만 작성 가능)
-        if Diary.objects.filter(member=request.user, date=diary_date).exists():
+        return data
+
+    def create(self, validated_data):
+        # 중복 일기 방지 (하루 한개만 작성 가능) - DB 유니크 제약으로 처리
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            if "unique_diary_per_member_date" not in str(e):
+                raise
             raise serializers.ValidationError(
-                "A diary already exists for the selected date."
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        "A diary already exists for the selected date."
+                    ]
+                }
             )
 
-        return data
-
     # content (일기내용) 필드의 길이 제한 검증 추가
     def validate_content(self, value):
         if not value or len(value.strip()) == 0:
@@ -83,6 +96,28 @@ class DiarySerializer(serializers.ModelSerializer):
         return value
 
 
+class DiarySearchResultSerializer(serializers.ModelSerializer):
+    # 검색 목록용 경량 응답 (전체 content 는 상세 조회에서만 제공)
+    snippet = serializers.CharField(read_only=True)
+    highlights = serializers.SerializerMethodField()
+    rank = serializers.FloatField(read_only=True, required=False)
+
+    class Meta:
+        model = Diary
+        fields = [
+            "diary_id",
+            "diary_title",
+            "date",
+            "moods",
+            "snippet",
+            "highlights",
+            "rank",
+        ]
+
+    def get_highlights(self, obj):
+        return highlight_spans(obj.snippet, self.context.get("q", ""))
+
+
 class FavoriteGenreSerializer(serializers.Serializer):
     moods = serializers.ListField(
         child=serializers.CharField(), allow_empty=False
@@ -97,10 +132,32 @@ class FavoriteGenreSerializer(serializers.Serializer):
     def validate(self, attrs):
         user = self.context["request"].user
         if "favorite_genre" not in attrs:
+            # 인증 캐시가 아닌 DB 의 최신 선호 장르 사용
             try:
-                member_info = MemberInfo.objects.get(social_account=user)
+                member_info = MemberInfo.objects.only("favorite_genre").get(
+                    social_account=user
+                )
                 attrs["favorite_genre"] = member_info.favorite_genre
             except MemberInfo.DoesNotExist:
                 pass
 
         return attrs
+
+
+class MoodBatchItemSerializer(serializers.Serializer):
+    id = serializers.CharField(max_length=64)
+    content = serializers.CharField()
+
+
+class MoodBatchSerializer(serializers.Serializer):
+    items = serializers.ListField(
+        child=MoodBatchItemSerializer(),
+        allow_empty=False,
+        max_length=settings.MOOD_BATCH_MAX_REQUEST_ITEMS,
+    )
+
+    def validate_items(self, value):
+        ids = [item["id"] for item in value]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("Item ids must be unique.")
+        return value
@@ -0,0 +1,139 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+
+from diary.cache import mood_cache
+from diary.models import Diary
+from diary.moods import lexicon_classifier
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def diaries(account):
+    return [
+        Diary.objects.create(
+            member=account,
+            diary_title="title",
+            content="content",
+            date=datetime.date(2024, month, day),
+        )
+        for month, day in [(1, 1), (1, 3), (2, 10)]
+    ]
+
+
+def test_diary_list(client, diaries):
+    response = client.get(reverse("diary:diary-main"), {"year": 2024})
+
+    assert response.status_code == 200
+    assert [item["date"] for item in response.data["data"]] == [
+        "2024-01-01",
+        "2024-01-03",
+        "2024-02-10",
+    ]
+
+
+def test_diary_list_compact(client, diaries):
+    response = client.get(
+        reverse("diary:diary-main"), {"year": 2024, "view": "compact"}
+    )
+
+    assert response.status_code == 200
+    assert response.data["data"] == {
+        "months": ["2024-01", "2024-02"],
+        "days": [0b101, 1 << 9],
+        "diary_ids": [
+            [str(diaries[0].diary_id), str(diaries[1].diary_id)],
+            [str(diaries[2].diary_id)],
+        ],
+    }
+
+
+# 단서 단어가 충분한 일기 / 단서가 한 번씩만 나오는 일기 / 단서가 없는 일기
+CLEAR_DIARY = "너무 행복했다. 정말 행복. 행복해서 기쁘다 기쁘다, 행복 행복"
+WEAK_DIARY = "오늘은 기쁘고 슬프고 화가 나고 불안했다"
+EMPTY_DIARY = "아무 의미 없는 글"
+
+
+@pytest.fixture
+def get_moods(client):
+    mood_cache.local.clear()
+
+    def post(content):
+        return client.post(
+            reverse("ai:get_emotions"), {"content": content}, format="json"
+        )
+
+    return post
+
+
+@pytest.fixture
+def gemini():
+    with mock.patch("diary.views.ai_views.generate_content") as generate:
+        generate.return_value = mock.Mock(text="슬픔, 불안, 후회, 외로움")
+        yield generate
+
+
+def test_lexicon_classifier():
+    assert lexicon_classifier.classify(CLEAR_DIARY, min_hits=6) == (
+        ["행복", "기쁨"],
+        pytest.approx(0.875),
+    )
+    assert lexicon_classifier.classify(EMPTY_DIARY) == ([], 0.0)
+
+
+def test_lexicon_classifier_min_hits():
+    # 단서가 한 번씩만 나오면 confidence 가 높아도 최소 출현 횟수 미달
+    moods, confidence = lexicon_classifier.classify(WEAK_DIARY)
+    assert moods == ["기쁨", "슬픔", "분노", "불안"]
+    assert confidence == pytest.approx(0.8)
+    assert lexicon_classifier.classify(WEAK_DIARY, min_hits=6) == ([], 0.0)
+
+
+@override_settings(MOOD_CLASSIFIER_MODE="llm")
+def test_get_moods_llm(get_moods, gemini):
+    response = get_moods(CLEAR_DIARY)
+
+    assert response.status_code == 200
+    assert response.data == {"moods": ["슬픔", "불안", "후회", "외로움"]}
+    gemini.assert_called_once()
+
+
+@override_settings(MOOD_CLASSIFIER_MODE="lexicon")
+def test_get_moods_lexicon(get_moods, gemini):
+    response = get_moods(CLEAR_DIARY)
+    assert response.status_code == 200
+    assert response.data == {"moods": ["행복", "기쁨"]}
+
+    # 단서가 없으면 기본 감정으로 채우지 않고 추출 실패
+    response = get_moods(EMPTY_DIARY)
+    assert response.status_code == 400
+    gemini.assert_not_called()
+
+
+@override_settings(MOOD_CLASSIFIER_MODE="fallback")
+def test_get_moods_fallback(get_moods, gemini):
+    gemini.side_effect = RuntimeError("upstream error")
+
+    response = get_moods(CLEAR_DIARY)
+
+    assert response.status_code == 200
+    assert response.data == {"moods": ["행복", "기쁨"], "degraded": True}
+
+
+@override_settings(MOOD_CLASSIFIER_MODE="prefilter")
+def test_get_moods_prefilter(get_moods, gemini):
+    # 단서가 충분하면 LLM 호출 생략
+    response = get_moods(CLEAR_DIARY)
+    assert response.status_code == 200
+    assert response.data == {"moods": ["행복", "기쁨"]}
+    gemini.assert_not_called()
+
+    # 단서가 부족하면 LLM 으로 분석
+    response = get_moods(WEAK_DIARY)
+    assert response.status_code == 200
+    assert response.data == {"moods": ["슬픔", "불안", "후회", "외로움"]}
+    gemini.assert_called_once()
@@ -1,9 +1,10 @@
 from django.urls.conf import path
 
-from diary.views.ai_views import GetMoods
+from diary.views.ai_views import GetMoods, MoodBatchView
 
 app_name = "ai"
 
 urlpatterns = [
     path("", GetMoods.as_view(), name="get_emotions"),
+    path("batch/", MoodBatchView.as_view(), name="get_emotions_batch"),
 ]
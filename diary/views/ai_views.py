@@ -1,32 +1,41 @@
 import logging
+import math
+import random
 
-import google.generativeai as genai
 import requests
+from django.conf import settings
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-
-from config import settings
-
-# Google API 키 설정 (본인의 키로 변경 필요)
-GOOGLE_API_KEY = settings.GOOGLE_API_KEY
-genai.configure(api_key=GOOGLE_API_KEY)
-
-import google.generativeai as genai
 from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from config import settings
-
-# Google API 키 설정 (본인의 키로 변경 필요)
-GOOGLE_API_KEY = settings.GOOGLE_API_KEY
-genai.configure(api_key=GOOGLE_API_KEY)
+from common.cache import content_hash
+from common.circuit import CircuitOpenError
+from common.ratelimit import QuotaExceededError
+from common.singleflight import SingleFlight
+from diary.cache import mood_cache, recommendation_cache, recommendation_key
+from diary.clients import generate_content
+from diary.mood_analysis import analyze_moods_batch
+from diary.moods import guess_moods, lexicon_classifier
+from diary.serializers import MoodBatchSerializer
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 동일한 LLM 요청 병합 (워커 간에는 advisory lock 사용)
+mood_flight = SingleFlight(
+    "mood", lock_timeout=settings.LLM_COALESCE_LOCK_TIMEOUT
+)
+music_flight = SingleFlight(
+    "recommendation", lock_timeout=settings.LLM_COALESCE_LOCK_TIMEOUT
+)
+
 
 class GetMoods(APIView):
+    throttle_scope = "mood"
+
     def post(self, request):
         logger.info("POST request received for GetMoods")
         content = request.data.get("content")
@@ -39,24 +48,67 @@ class GetMoods(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            emotions = self.get_emotions(content)
-            if not emotions:
-                logger.error("Failed to analyze emotions in GetMoods")
+        # 로컬 분류기 사용 방식: llm / lexicon / fallback / prefilter
+        mode = settings.MOOD_CLASSIFIER_MODE
+        if mode == "lexicon":
+            # 단서가 부족하면 LLM 과 마찬가지로 추출 실패로 응답
+            moods, _ = lexicon_classifier.classify(content)
+            if len(moods) < 2:
                 return Response(
-                    {"error": "Failed to analyze emotions."},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    {
+                        "error": "Emotion keywords could not be extracted "
+                        "from the diary."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
+            return Response({"moods": moods}, status=status.HTTP_200_OK)
+        if mode == "prefilter":
+            # 단서가 충분하면 LLM 호출 생략
+            moods, confidence = lexicon_classifier.classify(
+                content, min_hits=settings.MOOD_LEXICON_MIN_HITS
+            )
+            if (
+                len(moods) >= 2
+                and confidence >= settings.MOOD_LEXICON_CONFIDENCE
+            ):
+                logger.info(f"Lexicon mood analysis accepted: {moods}")
+                return Response({"moods": moods}, status=status.HTTP_200_OK)
 
-            moods = [
-                mood.strip() for mood in emotions.split(",") if mood.strip()
-            ]
-            logger.info(f"Successfully analyzed emotions: {moods}")
-            if len(moods) < 2:
-                raise RuntimeError("At least two emotions must be selected.")
+        try:
+            # 동일한 일기 내용은 캐시된 분석 결과 사용 (LLM 호출 생략)
+            cache_key = content_hash(content)
+            cached_moods = mood_cache.get(cache_key)
+            if cached_moods is not None:
+                logger.info(f"Mood analysis cache hit: {cached_moods}")
+                return Response(
+                    {"moods": cached_moods}, status=status.HTTP_200_OK
+                )
 
+            # 같은 일기에 대한 동시 요청은 한 번만 분석하고 결과를 공유
+            moods = mood_flight.do_shared(
+                cache_key,
+                lambda: self.analyze_moods(content, cache_key),
+                recheck=lambda: mood_cache.get(cache_key),
+            )
             return Response({"moods": moods}, status=status.HTTP_200_OK)
 
+        except QuotaExceededError as e:
+            # 전체 호출 한도 초과 시 LLM 을 호출하지 않고 바로 거부
+            logger.warning(f"Mood analysis rate limited: {str(e)}")
+            return Response(
+                {"error": "Too many requests. Please try again later."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(math.ceil(e.wait))},
+            )
+
+        except CircuitOpenError as e:
+            # LLM 을 사용할 수 없으면 간이 분류 결과로 응답 (캐시하지 않음)
+            logger.warning(f"Mood analysis degraded: {str(e)}")
+            return Response(
+                {"moods": guess_moods(content), "degraded": True},
+                status=status.HTTP_200_OK,
+            )
+
         except ValueError as e:
             # 감정 키워드를 추출할 수 없을 경우 에러 처리
             return Response(
@@ -65,12 +117,32 @@ class GetMoods(APIView):
             )
 
         except Exception as e:
+            if mode == "fallback":
+                logger.warning(f"Mood analysis fell back to lexicon: {str(e)}")
+                return Response(
+                    {"moods": guess_moods(content), "degraded": True},
+                    status=status.HTTP_200_OK,
+                )
             logger.error(f"Unexpected error occurred in GetMoods: {str(e)}")
             return Response(
                 {"error": f"Unexpected error occurred: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def analyze_moods(self, content, cache_key):
+        emotions = self.get_emotions(content)
+        if not emotions:
+            logger.error("Failed to analyze emotions in GetMoods")
+            raise RuntimeError("Failed to analyze emotions.")
+
+        moods = [mood.strip() for mood in emotions.split(",") if mood.strip()]
+        logger.info(f"Successfully analyzed emotions: {moods}")
+        if len(moods) < 2:
+            raise RuntimeError("At least two emotions must be selected.")
+
+        mood_cache.set(cache_key, moods)
+        return moods
+
     def get_emotions(self, content):
         # 감정 분석할 일기
         diary = content
@@ -100,8 +172,7 @@ class GetMoods(APIView):
         """
 
         try:
-            model = genai.GenerativeModel("gemini-2.0-flash")
-            response = model.generate_content(prompt)
+            response = generate_content(prompt)
 
             # 응답이 없거나 예상 형식이 아닐 경우
             if (
@@ -120,12 +191,101 @@ class GetMoods(APIView):
 
             return emotions
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error(f"Error during emotion analysis: {str(e)}")
             raise RuntimeError(f"Error during emotion analysis: {str(e)}")
 
 
+class MoodBatchView(APIView):
+    """
+    여러 일기의 감정을 한 번에 분석 (백필/가져오기용)
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_scope = "mood_batch"
+
+    def get_throttle_cost(self, request):
+        # 요청 횟수가 아닌 분석할 일기 수만큼 사용량 차감
+        data = request.data
+        items = data.get("items") if isinstance(data, dict) else None
+        if isinstance(items, list) and items:
+            return len(items)
+        return 1
+
+    def post(self, request):
+        serializer = MoodBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "invalid_request", "message": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        items = [
+            (item["id"], item["content"])
+            for item in serializer.validated_data["items"]
+        ]
+        logger.info(f"Batch mood analysis requested for {len(items)} items")
+
+        results, errors = analyze_moods_batch(items)
+        logger.info(
+            f"Batch mood analysis finished: {len(results)} succeeded, "
+            f"{len(errors)} failed"
+        )
+        return Response(
+            {
+                "results": [
+                    {"id": item_id, "moods": results[item_id]}
+                    for item_id, _ in items
+                    if item_id in results
+                ],
+                "failures": [
+                    {"id": item_id, "error": errors[item_id]}
+                    for item_id, _ in items
+                    if item_id in errors
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 def recommend_music(moods, favorite_genre):
+    # 같은 감정/장르 조합은 캐시된 추천 결과 풀에서 무작위로 제공
+    cache_key = recommendation_key(moods, favorite_genre)
+    pool = recommendation_cache.get(cache_key) or []
+    if len(pool) >= settings.MUSIC_RECOMMENDATION_POOL_SIZE:
+        logger.info("Music recommendation served from cache pool")
+        return random.choice(pool)
+
+    def newer_entry():
+        # 다른 워커가 그 사이에 추가한 추천 결과가 있으면 사용
+        shared_pool = recommendation_cache.get_shared(cache_key) or []
+        return shared_pool[-1] if len(shared_pool) > len(pool) else None
+
+    try:
+        # 같은 조합에 대한 동시 요청은 한 번만 생성하고 결과를 공유
+        return music_flight.do_shared(
+            cache_key,
+            lambda: add_music_recommendations(cache_key, moods, favorite_genre),
+            recheck=newer_entry,
+        )
+    except CircuitOpenError as e:
+        if not pool:
+            raise
+        # LLM 을 사용할 수 없으면 쌓여 있는 추천 결과 중에서 제공
+        logger.warning(f"Music recommendation served from pool: {str(e)}")
+        return random.choice(pool)
+
+
+def add_music_recommendations(cache_key, moods, favorite_genre):
+    recommendations = generate_music_recommendations(moods, favorite_genre)
+    pool = recommendation_cache.get_shared(cache_key) or []
+    if recommendations and recommendations not in pool:
+        recommendation_cache.set(cache_key, pool + [recommendations])
+    return recommendations
+
+
+def generate_music_recommendations(moods, favorite_genre):
     # 프롬프트 작성
     prompt = f"""
     사용자의 감정은 다음과 같습니다: {', '.join(moods)}
@@ -150,8 +310,7 @@ def recommend_music(moods, favorite_genre):
         목록 형태로 총 3곡만 출력해주세요.
         """
     try:
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        response = model.generate_content(prompt)
+        response = generate_content(prompt)
 
         # 응답이 없거나 예상 형식이 아닐 경우 빈 리스트 반환
         if (
@@ -183,6 +342,8 @@ def recommend_music(moods, favorite_genre):
         )
         return recommendations[:3]
 
+    except CircuitOpenError:
+        raise
     except Exception as e:
         logger.error(f"Error during music recommendation: {str(e)}")
         raise RuntimeError(f"Error during music recommendation: {str(e)}")
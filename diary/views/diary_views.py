@@ -1,39 +1,95 @@
+import calendar
 import datetime
 import logging
-from collections import Counter
 
-from django.db.models import Q
+from django.db import transaction
 from django.utils.timezone import now
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from diary.models import Diary
-from diary.serializers import DiarySerializer
+from common.conditional import member_condition
+from diary.enrichment import enqueue_enrichment
+from diary.models import DailyMoodCount, Diary
+from diary.pagination import DiarySearchPagination
+from diary.search import search_diaries
+from diary.serializers import DiarySearchResultSerializer, DiarySerializer
+from member.models import SocialAccount
 
 logger = logging.getLogger(__name__)
 
 
+def parse_calendar_range(params):
+    """
+    year/month 또는 start_date/end_date 파라미터를 (시작일, 종료일)로 변환
+    범위 파라미터가 없으면 (None, None)
+    """
+    if "year" in params:
+        year = int(params["year"])
+        if "month" in params:
+            month = int(params["month"])
+            # 말일 계산 시 9999년 12월에서도 날짜 범위를 넘지 않도록 monthrange 사용
+            start_date = datetime.date(year, month, 1)
+            end_date = start_date.replace(
+                day=calendar.monthrange(year, month)[1]
+            )
+        else:
+            start_date = datetime.date(year, 1, 1)
+            end_date = datetime.date(year, 12, 31)
+        return start_date, end_date
+
+    start_date = params.get("start_date")
+    end_date = params.get("end_date")
+    return (
+        datetime.date.fromisoformat(start_date) if start_date else None,
+        datetime.date.fromisoformat(end_date) if end_date else None,
+    )
+
+
 class DiaryListView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @member_condition()
     def get(self, request):
         logger.info(
             "Retrieving diary list for user %s", request.user.social_account_id
         )
-        all_diary = Diary.objects.filter(
-            member=request.user.social_account_id
-        ).values("diary_id", "date")
-        diary_data = [
-            {
-                "date": diary["date"].strftime("%Y-%m-%d"),
-                "diary_id": str(diary["diary_id"]),
-            }
-            for diary in all_diary
-        ]
-        logger.info("Successfully retrieved %d diaries", len(diary_data))
+        try:
+            start_date, end_date = parse_calendar_range(request.GET)
+        except ValueError:
+            logger.warning("Invalid calendar range: %s", request.GET)
+            return Response(
+                {
+                    "error": "invalid_request",
+                    "message": "Use year/month or start_date/end_date (YYYY-MM-DD).",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # (member, date) 유니크 인덱스로 범위 조회
+        all_diary = Diary.objects.filter(member=request.user.social_account_id)
+        if start_date:
+            all_diary = all_diary.filter(date__gte=start_date)
+        if end_date:
+            all_diary = all_diary.filter(date__lte=end_date)
+        all_diary = all_diary.order_by("date").values_list("diary_id", "date")
+
+        # format 은 DRF 의 응답 형식 지정 파라미터라 view 로 구분
+        if request.GET.get("view") == "compact":
+            diary_data = compact_calendar(all_diary)
+            logger.info(
+                "Successfully retrieved compact calendar for %d months",
+                len(diary_data["months"]),
+            )
+        else:
+            diary_data = [
+                {"date": date.isoformat(), "diary_id": str(diary_id)}
+                for diary_id, date in all_diary
+            ]
+            logger.info("Successfully retrieved %d diaries", len(diary_data))
         return Response(
             {
                 "message": "Successfully displayed diary list with date.",
@@ -43,9 +99,27 @@ class DiaryListView(APIView):
         )
 
 
+def compact_calendar(diaries):
+    """
+    월별 작성일 비트맵 (1일 = 1 << 0) + 작성일 순서의 diary_id 목록
+    diaries 는 날짜순 (diary_id, date) 목록
+    """
+    months, days, diary_ids = [], [], []
+    for diary_id, date in diaries:
+        month = f"{date.year:04d}-{date.month:02d}"
+        if not months or months[-1] != month:
+            months.append(month)
+            days.append(0)
+            diary_ids.append([])
+        days[-1] |= 1 << (date.day - 1)
+        diary_ids[-1].append(str(diary_id))
+    return {"months": months, "days": days, "diary_ids": diary_ids}
+
+
 class DiaryDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @member_condition()
     def get(self, request, diary_id):
         logger.info("Retrieving diary detail for diary_id %s", diary_id)
         if diary_id:
@@ -75,7 +149,12 @@ class DiaryDetailView(APIView):
         diary = get_object_or_404(
             Diary, diary_id=diary_id, member=request.user.social_account_id
         )
-        diary.delete()
+        with transaction.atomic():
+            # 동시 삭제 요청 시 집계가 두 번 차감되지 않도록 실제 삭제된 경우만 반영
+            deleted, _ = Diary.objects.filter(diary_id=diary.diary_id).delete()
+            if deleted:
+                DailyMoodCount.objects.remove_diary(diary)
+                SocialAccount.objects.bump_data_version(diary.member_id)
         logger.info("Successfully deleted diary")
         return Response(
             {"message": "Successfully deleted."},
@@ -83,6 +162,43 @@ class DiaryDetailView(APIView):
         )
 
 
+class DiaryEnrichmentView(APIView):
+    """
+    일기 감정/추천 음악 백그라운드 작업 상태 조회 (클라이언트 폴링용)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, diary_id):
+        diary = get_object_or_404(
+            Diary.objects.select_related("enrichment").only(
+                "diary_id",
+                "moods",
+                "rec_music",
+                "enrichment__status",
+                "enrichment__attempts",
+                "enrichment__last_error",
+                "enrichment__updated_at",
+            ),
+            diary_id=diary_id,
+            member=request.user.social_account_id,
+        )
+        enrichment = getattr(diary, "enrichment", None)
+        return Response(
+            {
+                "diary_id": diary.diary_id,
+                # 작업이 없으면 처음부터 모두 입력된 일기
+                "status": enrichment.status if enrichment else "not_required",
+                "attempts": enrichment.attempts if enrichment else 0,
+                "error": enrichment.last_error if enrichment else "",
+                "updated_at": enrichment.updated_at if enrichment else None,
+                "moods": diary.moods,
+                "rec_music": diary.rec_music,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class DiaryCreateView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -95,12 +211,30 @@ class DiaryCreateView(APIView):
         )
         if serializer.is_valid():
             created_at = request.data.get("created_at", datetime.date.today())
-            serializer.save(member=request.user, created_at=created_at)
+            try:
+                with transaction.atomic():
+                    diary = serializer.save(
+                        member=request.user, created_at=created_at
+                    )
+                    DailyMoodCount.objects.add_diary(diary)
+                    SocialAccount.objects.bump_data_version(diary.member_id)
+                    # 감정/추천 음악 없이 작성된 일기는 백그라운드에서 채움
+                    enrichment = None
+                    if not diary.moods or diary.rec_music is None:
+                        enrichment = enqueue_enrichment(diary)
+            except ValidationError as e:
+                # 같은 날짜 일기 중복 (유니크 제약 위반)
+                logger.warning("Invalid diary data: %s", e.detail)
+                return Response(
+                    {"error": "invalid_request", "message": e.detail},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             logger.info("Successfully created diary")
             return Response(
                 {
                     "message": "Successfully created diary.",
                     "data": serializer.data,
+                    "enrichment": enrichment and enrichment.status,
                 },
                 status=status.HTTP_201_CREATED,
             )
@@ -130,24 +264,49 @@ class DiarySearchView(APIView):
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        diaries = Diary.objects.filter(
-            Q(diary_title__icontains=q) | Q(content__icontains=q),
-            member=request.user,
-        ).order_by("-created_at")
+        sort = request.query_params.get("sort", "relevance")
+        if sort not in DiarySearchPagination.orderings:
+            logger.warning("Invalid search sort: %s", sort)
+            return Response(
+                {
+                    "error": "invalid_request",
+                    "message": "sort must be one of: relevance, recent.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        if not diaries.exists():
+        # 목록에는 content 전체 대신 요약문만 조회
+        diaries = search_diaries(
+            Diary.objects.filter(member=request.user).only(
+                "diary_id", "diary_title", "date", "moods", "created_at"
+            ),
+            q,
+        )
+        paginator = DiarySearchPagination(sort=sort)
+        page = paginator.paginate_queryset(diaries, request, view=self)
+
+        if not page and not request.query_params.get(
+            paginator.cursor_query_param
+        ):
             logger.info("No diaries found for search query")
             return Response(
                 {"error": "not_found", "message": "not found for your search."},
                 status=status.HTTP_200_OK,
             )
 
-        serializer = DiarySerializer(diaries, many=True)
+        serializer = DiarySearchResultSerializer(
+            page, many=True, context={"q": q}
+        )
         logger.info(
-            "Successfully searched diaries, found %d results", len(diaries)
+            "Successfully searched diaries, returned %d results", len(page)
         )
         return Response(
-            {"message": "Successfully searched diary", "data": serializer.data},
+            {
+                "message": "Successfully searched diary",
+                "data": serializer.data,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
+            },
             status=status.HTTP_200_OK,
         )
 
@@ -155,6 +314,7 @@ class DiarySearchView(APIView):
 class EmotionStatusView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @member_condition(include_date=True)
     def get(self, request):
         period = request.GET.get("period")
         today = now().date()
@@ -177,17 +337,9 @@ class EmotionStatusView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        all_diary = Diary.objects.filter(
-            member=request.user.social_account_id,
-            date__gte=start_date,
-            date__lte=today,
+        mood_counts = DailyMoodCount.objects.mood_counts(
+            request.user.social_account_id, start_date, today
         )
-
-        all_moods = []
-        for diary in all_diary:
-            all_moods.extend(diary.moods)
-
-        mood_counts = Counter(all_moods)
         logger.info("Successfully retrieved emotion status")
         return Response(
             {
@@ -198,3 +350,115 @@ class EmotionStatusView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+def bucket_starts(start_date, end_date, bucket, limit):
+    """
+    PostgreSQL date_trunc 와 같은 기준(주: 월요일, 월: 1일)으로 구간 시작일 생성
+    limit 개를 넘으면 더 만들지 않음 (호출하는 쪽에서 개수로 한도 초과 판단)
+    """
+    if bucket == "week":
+        current = start_date - datetime.timedelta(days=start_date.weekday())
+    elif bucket == "month":
+        current = start_date.replace(day=1)
+    else:
+        current = start_date
+
+    starts = []
+    while current <= end_date and len(starts) <= limit:
+        starts.append(current)
+        try:
+            if bucket == "day":
+                current += datetime.timedelta(days=1)
+            elif bucket == "week":
+                current += datetime.timedelta(days=7)
+            else:
+                current = (current + datetime.timedelta(days=32)).replace(day=1)
+        except OverflowError:
+            # date.max 를 넘는 다음 구간은 없음
+            break
+    return starts
+
+
+class EmotionTrendView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    BUCKETS = ("day", "week", "month")
+    MAX_BUCKETS = 731
+
+    @member_condition(include_date=True)
+    def get(self, request):
+        bucket = request.GET.get("bucket", "day")
+        today = now().date()
+        logger.info(
+            "Retrieving emotion trend for user %s, bucket: %s",
+            request.user.social_account_id,
+            bucket,
+        )
+
+        if bucket not in self.BUCKETS:
+            logger.warning("Invalid bucket specified: %s", bucket)
+            return Response(
+                {"error": "Please use one of: day, week, or month."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            end_date = datetime.datetime.strptime(
+                request.GET.get("end_date", today.isoformat()), "%Y-%m-%d"
+            ).date()
+            start_date = datetime.datetime.strptime(
+                request.GET.get(
+                    "start_date",
+                    (end_date - datetime.timedelta(days=29)).isoformat(),
+                ),
+                "%Y-%m-%d",
+            ).date()
+        except (ValueError, OverflowError):
+            logger.warning("Invalid date range for emotion trend")
+            return Response(
+                {"error": "Invalid date format. Use YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if start_date > end_date:
+            return Response(
+                {"error": "start_date must be before end_date."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        buckets = bucket_starts(start_date, end_date, bucket, self.MAX_BUCKETS)
+        if len(buckets) > self.MAX_BUCKETS:
+            return Response(
+                {"error": f"Too many buckets (max {self.MAX_BUCKETS})."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rows = DailyMoodCount.objects.bucketed_counts(
+            request.user.social_account_id, start_date, end_date, bucket
+        )
+
+        # 열 단위(columnar) 응답: counts[감정 인덱스][구간 인덱스]
+        bucket_index = {start: i for i, start in enumerate(buckets)}
+        moods = []
+        counts = []
+        mood_index = {}
+        for bucket_start, mood, mood_count in rows:
+            if mood not in mood_index:
+                mood_index[mood] = len(moods)
+                moods.append(mood)
+                counts.append([0] * len(buckets))
+            counts[mood_index[mood]][bucket_index[bucket_start]] = mood_count
+
+        logger.info("Successfully retrieved emotion trend")
+        return Response(
+            {
+                "bucket": bucket,
+                "start_date": start_date,
+                "end_date": end_date,
+                "buckets": buckets,
+                "moods": moods,
+                "counts": counts,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -1,60 +1,136 @@
 import logging
+import math
+from concurrent.futures import wait
 
 from django.conf import settings
-from googleapiclient.discovery import build
+from django.db import DatabaseError
 from rest_framework import permissions, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.circuit import CircuitOpenError
+from common.executors import DBThreadPoolExecutor
+from common.ratelimit import QuotaExceededError
+from diary.clients import search_youtube
+from diary.models import TrackVideo, track_key
 from diary.serializers import FavoriteGenreSerializer
 from diary.views.ai_views import recommend_music
 
 logger = logging.getLogger(__name__)
 
-YOUTUBE_API_KEY = settings.YOUTUBE_API_KEY
-youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+# 곡별 YouTube 검색을 병렬로 처리하기 위한 워커 풀
+YOUTUBE_LOOKUP_TIMEOUT = settings.YOUTUBE_LOOKUP_TIMEOUT
+youtube_executor = DBThreadPoolExecutor(
+    max_workers=settings.YOUTUBE_LOOKUP_WORKERS,
+    thread_name_prefix="youtube-lookup",
+)
 
 
-def get_youtube_info(title, artist):
+def fetch_youtube_video(title, artist):
+    # YouTube 검색 API 호출 (결과가 없으면 None)
+    logger.info(f"Fetching YouTube info for {title} - {artist}")
+    query = f"{title} {artist} official"
+    response = search_youtube(query)
+
+    items = response.get("items", [])
+    if not items:
+        return None
+    video = items[0]
+    return {
+        "video_id": video["id"]["videoId"],
+        "thumbnail": video["snippet"]["thumbnails"]["high"]["url"],
+    }
+
+
+def build_youtube_info(title, artist, video_id, thumbnail):
+    return {
+        "video_id": video_id,
+        "title": title,
+        "artist": artist,
+        "thumbnail": thumbnail,
+        "embedUrl": f"https://www.youtube.com/watch?v={video_id}",
+    }
+
+
+def get_youtube_infos(recommendations):
+    # 캐시에 없는 곡만 동시에 조회하고, 결과는 추천 순서대로 반환
+    tracks = [(rec["title"], rec["artist"]) for rec in recommendations]
     try:
-        logger.info(f"Fetching YouTube info for {title} - {artist}")
-        query = f"{title} {artist} official"
-        response = (
-            youtube.search()
-            .list(
-                q=query,
-                part="snippet",
-                type="video",
-                maxResults=1,
+        resolved = TrackVideo.objects.lookup_many(tracks)
+    except DatabaseError as e:
+        logger.warning(f"YouTube resolution cache lookup failed: {str(e)}")
+        resolved = {}
+
+    futures = {}
+    for title, artist in tracks:
+        if track_key(title, artist) not in resolved:
+            futures[(title, artist)] = youtube_executor.submit(
+                fetch_youtube_video, title, artist
             )
-            .execute()
-        )
+    _, not_done = wait(futures.values(), timeout=YOUTUBE_LOOKUP_TIMEOUT)
+
+    results = []
+    new_entries = []
+    quota_error = None
+    for title, artist in tracks:
+        cached = resolved.get(track_key(title, artist))
+        if cached is not None:
+            info = (
+                build_youtube_info(
+                    title, artist, cached.video_id, cached.thumbnail
+                )
+                if cached.video_id
+                else None
+            )
+        elif futures[(title, artist)] in not_done:
+            # 느린 곡은 기다리지 않고 해당 슬롯만 에러로 처리
+            futures[(title, artist)].cancel()
+            info = {"error": "YouTube lookup timed out"}
+        else:
+            try:
+                video = futures[(title, artist)].result()
+                new_entries.append(
+                    TrackVideo.for_track(title, artist, **(video or {}))
+                )
+                info = (
+                    build_youtube_info(title, artist, **video)
+                    if video
+                    else None
+                )
+            except QuotaExceededError as e:
+                logger.warning(f"YouTube lookup skipped for {title}: {str(e)}")
+                quota_error = e
+                info = {"error": str(e)}
+            except Exception as e:
+                logger.error(
+                    f"YouTube API error for {title}: {str(e)}", exc_info=True
+                )
+                info = {"error": str(e)}
+
+        if info and "error" not in info:
+            results.append(info)
+            logger.debug(f"Added YouTube info for {title}")
+        else:
+            error_msg = info.get("error") if info else "No YouTube data"
+            logger.warning(f"Failed to process {title}: {error_msg}")
+            results.append({"error": f"Failed to get YouTube info for {title}"})
+
+    if new_entries:
+        try:
+            TrackVideo.objects.store_many(new_entries)
+        except DatabaseError as e:
+            logger.warning(f"YouTube resolution cache write failed: {str(e)}")
 
-        items = response.get("items", [])
-        if items:
-            video = items[0]
-            video_id = video["id"]["videoId"]
-            snippet = video["snippet"]
-            logger.debug(f"Successfully fetched YouTube info for {title}")
-            return {
-                "video_id": video_id,
-                "title": title,
-                "artist": artist,
-                "thumbnail": snippet["thumbnails"]["high"]["url"],
-                "embedUrl": f"https://www.youtube.com/watch?v={video_id}",
-            }
-        logger.warning(f"No YouTube results found for {title} - {artist}")
-        return None
-    except Exception as e:
-        logger.error(f"YouTube API error for {title}: {str(e)}", exc_info=True)
-        return {
-            "error": f"Error occurred while fetching YouTube info: {str(e)}"
-        }
+    # 한도 때문에 한 곡도 찾지 못했으면 에러 목록 대신 한도 초과로 처리
+    if quota_error and all("error" in info for info in results):
+        raise quota_error
+    return results
 
 
 class MusicRecommendView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = "music"
 
     def post(self, request):
         logger.info(
@@ -78,26 +154,7 @@ class MusicRecommendView(APIView):
                 f"Received {len(recommendations)} recommendations from AI"
             )
 
-            results = []
-
-            for rec in recommendations:
-                logger.debug(f"Processing recommendation: {rec['title']}")
-                info = get_youtube_info(rec["title"], rec["artist"])
-
-                if info and "error" not in info:
-                    results.append(info)
-                    logger.debug(f"Added YouTube info for {rec['title']}")
-                else:
-                    error_msg = info.get("error") if info else "No YouTube data"
-                    logger.warning(
-                        f"Failed to process {rec['title']}: {error_msg}"
-                    )
-                    results.append(
-                        {
-                            "error": f"Failed to get YouTube info for {rec['title']}"
-                        }
-                    )
-
+            results = get_youtube_infos(recommendations)
             logger.info(f"Successfully processed {len(results)} tracks")
             return Response(
                 {
@@ -107,6 +164,25 @@ class MusicRecommendView(APIView):
                 status=status.HTTP_200_OK,
             )
 
+        except QuotaExceededError as e:
+            # 전체 호출 한도 초과 시 외부 API 를 호출하지 않고 바로 거부
+            logger.warning(f"Recommendation rate limited: {str(e)}")
+            return Response(
+                {"error": "Too many requests. Please try again later."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(math.ceil(e.wait))},
+            )
+
+        except CircuitOpenError as e:
+            logger.warning(f"Recommendation unavailable: {str(e)}")
+            return Response(
+                {"error": "Music recommendation is temporarily unavailable."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={
+                    "Retry-After": str(settings.GEMINI_CIRCUIT_RECOVERY_TIMEOUT)
+                },
+            )
+
         except Exception as e:
             logger.error(f"Recommendation failed: {str(e)}", exc_info=True)
             return Response(
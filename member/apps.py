@@ -4,3 +4,21 @@ from django.apps import AppConfig
 class MemberConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "member"
+
+    def ready(self):
+        from rest_framework_simplejwt.token_blacklist.models import (
+            BlacklistedToken,
+            OutstandingToken,
+        )
+
+        from common.metrics import estimated_row_count, metrics
+
+        # 토큰 테이블 크기 (pg_class 추정치, 정리 작업 확인용)
+        metrics.register_gauge(
+            "db.outstanding_tokens.estimated_rows",
+            lambda: estimated_row_count(OutstandingToken),
+        )
+        metrics.register_gauge(
+            "db.blacklisted_tokens.estimated_rows",
+            lambda: estimated_row_count(BlacklistedToken),
+        )
@@ -0,0 +1,97 @@
+import logging
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from common.cache import LRUCache
+from member.models import MemberInfo, SocialAccount
+
+logger = logging.getLogger(__name__)
+
+# social_account_id -> (SocialAccount 값, MemberInfo 값 또는 None)
+user_cache = LRUCache(
+    "auth.user",
+    maxsize=settings.AUTH_USER_CACHE_MAXSIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL,
+)
+
+
+def _field_names(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def _to_record(social_account):
+    account_values = tuple(
+        getattr(social_account, name) for name in _field_names(SocialAccount)
+    )
+    member_info = getattr(social_account, "member_info", None)
+    member_values = (
+        tuple(getattr(member_info, name) for name in _field_names(MemberInfo))
+        if member_info
+        else None
+    )
+    return account_values, member_values
+
+
+def _from_record(record):
+    # 요청마다 새 인스턴스를 만들어 요청 간 객체 공유/변경을 방지
+    account_values, member_values = record
+    social_account = SocialAccount.from_db(
+        DEFAULT_DB_ALIAS, _field_names(SocialAccount), account_values
+    )
+    if member_values is None:
+        # member_info 접근 시 추가 쿼리 없이 DoesNotExist 발생
+        social_account._state.fields_cache["member_info"] = None
+    else:
+        member_info = MemberInfo.from_db(
+            DEFAULT_DB_ALIAS, _field_names(MemberInfo), member_values
+        )
+        social_account.member_info = member_info
+    return social_account
+
+
+def invalidate_cached_user(social_account_id):
+    user_cache.delete(str(social_account_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    계정 + 회원정보를 짧은 TTL 로 캐시하는 JWT 인증
+    (다른 워커의 변경은 최대 AUTH_USER_CACHE_TTL 동안 반영이 늦을 수 있음)
+    인증에만 사용하고, 응답/저장에 쓰는 회원정보는 뷰에서 DB 로 조회
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        record = user_cache.get(str(user_id))
+        if record is None:
+            try:
+                social_account = SocialAccount.objects.with_member_info().get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except SocialAccount.DoesNotExist as e:
+                raise AuthenticationFailed(
+                    _("User not found"), code="user_not_found"
+                ) from e
+            record = _to_record(social_account)
+            user_cache.set(str(user_id), record)
+
+        user = _from_record(record)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+        return user
@@ -0,0 +1,17 @@
+import logging
+
+from django.conf import settings
+
+from common.jobs import register_job
+from member.tokens import prune_expired_tokens
+
+logger = logging.getLogger(__name__)
+
+
+@register_job("member.prune_tokens", every=settings.TOKEN_PRUNE_INTERVAL)
+def prune_tokens(job):
+    deleted_tokens, deleted_blacklist = prune_expired_tokens()
+    logger.info(
+        f"Pruned {deleted_tokens} outstanding tokens and "
+        f"{deleted_blacklist} blacklisted tokens"
+    )
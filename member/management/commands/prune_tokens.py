@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from member.tokens import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired outstanding and blacklisted JWT refresh tokens in "
+        "small batches. The job worker also runs this periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to pause between batches",
+        )
+
+    def handle(self, *args, **options):
+        deleted_tokens, deleted_blacklist = prune_expired_tokens(
+            options["batch_size"], options["sleep"]
+        )
+        self.stdout.write(
+            f"Deleted {deleted_tokens} outstanding tokens and "
+            f"{deleted_blacklist} blacklisted tokens"
+        )
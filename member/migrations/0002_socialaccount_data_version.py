@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-18 20:15
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("member", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="socialaccount",
+            name="data_updated_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="socialaccount",
+            name="data_version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -6,8 +6,10 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import F
 from django.db.models.manager import Manager
+from django.utils import timezone
 
 
 class SocialAccountManager(BaseUserManager):
@@ -56,6 +58,70 @@ class SocialAccountManager(BaseUserManager):
             email, provider, provider_user_id, password=password, **extra_fields
         )
 
+    def upsert_social_account(
+        self, provider, provider_user_id, email, profile_image=None
+    ):
+        """
+        (provider, provider_user_id) 기준으로 계정을 조회하거나 생성 (쿼리 1회)
+        동시에 같은 로그인 요청이 들어와도 한 계정만 생성됨
+        반환값: (계정, 생성 여부)
+        다른 계정이 같은 이메일을 사용 중이면 IntegrityError 발생
+        """
+        connection = connections[self.db]
+        account = self.model(
+            provider=provider,
+            provider_user_id=provider_user_id,
+            email=email,
+            profile_image=profile_image or "",
+            is_active=False,
+        )
+        fields = self.model._meta.concrete_fields
+        params = [
+            field.get_db_prep_save(
+                field.pre_save(account, add=True), connection
+            )
+            for field in fields
+        ]
+
+        quote = connection.ops.quote_name
+        columns = ", ".join(quote(field.column) for field in fields)
+        sql = f"""
+            INSERT INTO {quote(self.model._meta.db_table)} ({columns})
+            VALUES ({", ".join(["%s"] * len(fields))})
+            ON CONFLICT ({quote("provider")}, {quote("provider_user_id")})
+            DO UPDATE SET {quote("provider")} = EXCLUDED.{quote("provider")}
+            RETURNING {columns}, (xmax = 0) AS created
+        """
+        with transaction.atomic(using=self.db):
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                *values, created = cursor.fetchone()
+
+        return (
+            self.model.from_db(
+                self.db, [field.attname for field in fields], values
+            ),
+            created,
+        )
+
+    def with_member_info(self, *fields):
+        """
+        계정과 회원정보를 한 번의 쿼리(JOIN)로 조회
+        fields 를 지정하면 해당 컬럼만 조회 (예: "email", "member_info__nickname")
+        """
+        queryset = self.select_related("member_info")
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    def bump_data_version(self, social_account_id):
+        """
+        일기/프로필 변경 시 회원 데이터 버전 증가 (ETag/Last-Modified 기준)
+        """
+        return self.filter(social_account_id=social_account_id).update(
+            data_version=F("data_version") + 1, data_updated_at=timezone.now()
+        )
+
 
 # 소셜 계정을 기본 User 모델로 사용
 class SocialAccount(AbstractBaseUser, PermissionsMixin):
@@ -71,6 +137,9 @@ class SocialAccount(AbstractBaseUser, PermissionsMixin):
     is_admin = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 일기/프로필 데이터가 바뀔 때마다 증가 (조건부 GET 용)
+    data_version = models.PositiveBigIntegerField(default=0)
+    data_updated_at = models.DateTimeField(default=timezone.now)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["provider", "provider_user_id"]
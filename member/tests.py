@@ -0,0 +1,39 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+
+
+def test_login_queries(account, django_assert_num_queries):
+    # 계정 + 회원정보 조회(JOIN) 1회, 리프레시 토큰 기록 1회
+    with django_assert_num_queries(2):
+        response = APIClient().post(
+            reverse("member:login"), {"email": account.email}, format="json"
+        )
+
+    assert response.status_code == 200
+    assert response.data["user"]["nickname"] == "member"
+
+
+@pytest.mark.parametrize("url_name", ["member:mypage", "member:profile"])
+def test_member_view_queries(client, url_name, django_assert_num_queries):
+    # 인증(계정 + 회원정보 JOIN), 데이터 버전(ETag), 회원정보 조회
+    with django_assert_num_queries(3):
+        response = client.get(reverse(url_name))
+    assert response.status_code == 200
+
+    # 인증 캐시 적중 시 인증 쿼리 생략
+    with django_assert_num_queries(2):
+        response = client.get(reverse(url_name))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("url_name", ["member:mypage", "member:profile"])
+def test_member_view_not_modified(client, url_name, django_assert_num_queries):
+    etag = client.get(reverse(url_name))["ETag"]
+
+    # 변경이 없으면 데이터 버전만 확인하고 304 반환
+    with django_assert_num_queries(1):
+        response = client.get(reverse(url_name), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
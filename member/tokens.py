@@ -0,0 +1,37 @@
+import time
+
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from common.metrics import metrics
+
+
+def prune_expired_tokens(batch_size=1000, sleep=0.1):
+    """
+    만료된 리프레시 토큰(OutstandingToken)과 블랙리스트를 배치 단위로 삭제
+    반환값: (삭제한 토큰 수, 삭제한 블랙리스트 수)
+    """
+    now = timezone.now()
+    deleted_tokens = deleted_blacklist = 0
+    while True:
+        # 만료 시각 이후에는 서명 검증에서 거부되므로 블랙리스트도 불필요
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        # 배치마다 별도 트랜잭션(autocommit)으로 짧게 락을 잡음
+        count, _ = BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        deleted_blacklist += count
+        count, _ = OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted_tokens += count
+        if sleep:
+            time.sleep(sleep)
+
+    metrics.incr("auth.tokens.pruned", deleted_tokens)
+    return deleted_tokens, deleted_blacklist
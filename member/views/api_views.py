@@ -9,6 +9,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView, Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from common.conditional import member_condition
+from member.authentication import invalidate_cached_user
 from member.models import MemberInfo, SocialAccount
 from member.serializer import (
     MemberInfoSerializer,
@@ -58,6 +60,10 @@ class CreateMemberInfo(APIView):
             social_account.is_active = True
             social_account.save()
             serializer.save()
+            SocialAccount.objects.bump_data_version(
+                social_account.social_account_id
+            )
+            invalidate_cached_user(social_account.social_account_id)
             logger.info(f"Member info created for email: {email}")
 
             refresh = RefreshToken.for_user(social_account)
@@ -89,11 +95,23 @@ class Login(APIView):
             return Response(
                 {"error": "Invalid email"}, status=status.HTTP_400_BAD_REQUEST
             )
-        member_info = MemberInfo.objects.filter(
-            social_account__email=email
-        ).first()
+        # 로그인 응답에 필요한 계정/회원정보 컬럼만 한 번에 조회
+        social_account = (
+            SocialAccount.objects.with_member_info(
+                "social_account_id",
+                "email",
+                "provider",
+                "provider_user_id",
+                "profile_image",
+                "is_active",
+                "member_info__nickname",
+            )
+            .filter(email=email)
+            .first()
+        )
+        member_info = getattr(social_account, "member_info", None)
 
-        if not member_info or not member_info.social_account.is_active:
+        if not member_info or not social_account.is_active:
             logger.warning(
                 f"Member information registration required for email: {email}"
             )
@@ -102,10 +120,8 @@ class Login(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        refresh = RefreshToken.for_user(member_info.social_account)
-        social_account_serializer = SocialAccountSerializer(
-            member_info.social_account
-        )
+        refresh = RefreshToken.for_user(social_account)
+        social_account_serializer = SocialAccountSerializer(social_account)
 
         logger.info(f"Successful login for email: {email}")
         return Response(
@@ -155,8 +171,10 @@ class Logout(APIView):
 class MemberMypageView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @member_condition()
     def get(self, request):
         logger.info("GET request received for MemberMypageView")
+        # 인증 캐시는 다른 워커의 변경이 늦게 반영되므로 회원정보는 DB 에서 조회
         member_info = MemberInfo.objects.filter(
             social_account=request.user
         ).first()
@@ -180,6 +198,7 @@ class MemberMypageView(APIView):
     def patch(self, request):
         logger.info("PATCH request received for MemberMypageView")
         social_account = request.user
+        # 캐시된 인스턴스로 저장하면 다른 워커에서 바뀐 필드를 되돌리므로 새로 조회
         member_info = MemberInfo.objects.filter(
             social_account=social_account
         ).first()
@@ -194,6 +213,10 @@ class MemberMypageView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         serializer.save()
+        SocialAccount.objects.bump_data_version(
+            social_account.social_account_id
+        )
+        invalidate_cached_user(social_account.social_account_id)
         logger.info(f"Member info updated for user: {social_account}")
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -202,6 +225,7 @@ class MemberMypageView(APIView):
         social_account = request.user
 
         social_account.delete()
+        invalidate_cached_user(social_account.social_account_id)
         logger.info(f"User account deleted: {social_account}")
         return Response(
             {"message": "Successfully deleted"}, status=status.HTTP_200_OK
@@ -211,10 +235,14 @@ class MemberMypageView(APIView):
 class MemberProfileView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @member_condition()
     def get(self, request):
         logger.info("GET request received for MemberProfileView")
-        member_info = MemberInfo.objects.filter(
-            social_account=request.user
-        ).first()
+        # 인증 캐시는 다른 워커의 변경이 늦게 반영되므로 계정/회원정보를 함께 새로 조회
+        member_info = (
+            MemberInfo.objects.select_related("social_account")
+            .filter(social_account=request.user)
+            .first()
+        )
         serializer = ProfileSerializer(member_info)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,11 +1,13 @@
 import logging
 
 import requests
+from django.db import IntegrityError
 from django.forms.models import model_to_dict
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.http import get_http_client
 from config import settings
 from member.models import SocialAccount
 from member.serializer import SocialAccountInfoSerializer
@@ -13,6 +15,26 @@ from member.serializer import SocialAccountInfoSerializer
 logger = logging.getLogger(__name__)  # logger 객체 생성
 
 
+def upsert_social_account(provider, provider_user_id, email, profile_image):
+    # 카카오/네이버 공통: 계정 조회 또는 생성을 한 번의 쿼리로 처리
+    try:
+        social_account, created = SocialAccount.objects.upsert_social_account(
+            provider, provider_user_id, email, profile_image
+        )
+    except IntegrityError as e:
+        diag = getattr(e.__cause__, "diag", None)
+        if "email" not in (getattr(diag, "constraint_name", None) or ""):
+            raise
+        logger.warning(f"Account with email {email} already exists")
+        return {"error": "An account with this email already exists."}
+
+    if created:
+        logger.info(f"New {provider} account created for user: {email}")
+    else:
+        logger.info(f"Existing {provider} account found for user: {email}")
+    return model_to_dict(social_account)
+
+
 class KakaoLoginCallback(APIView):
     def get(self, request):
         code = request.GET.get("code")
@@ -65,7 +87,9 @@ class KakaoLoginCallback(APIView):
             "Content-Type": "application/x-www-form-urlencoded; charset=utf-8"
         }
         try:
-            response = requests.post(url, headers=headers, data=data)
+            response = get_http_client("kakao").post(
+                url, headers=headers, data=data
+            )
             response.raise_for_status()
             return response.json().get("access_token")
         except requests.RequestException as e:
@@ -76,7 +100,7 @@ class KakaoLoginCallback(APIView):
         url = "https://kapi.kakao.com/v2/user/me"
         headers = {"Authorization": f"Bearer {access_token}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = get_http_client("kakao").get(url, headers=headers)
             print("Get MemberInfo data:", response)
             response.raise_for_status()
             return response.json()
@@ -91,26 +115,9 @@ class KakaoLoginCallback(APIView):
         profile_image = profile.get("profile_image_url", "")
         provider_user_id = str(member_info["id"])
 
-        try:
-            social_account = SocialAccount.objects.get(
-                provider="kakao", provider_user_id=provider_user_id
-            )
-            logger.info(f"Existing Kakao account found for user: {email}")
-        except SocialAccount.DoesNotExist:
-            if SocialAccount.objects.filter(email=email).exists():
-                logger.warning(f"Account with email {email} already exists")
-                return {"error": "An account with this email already exists."}
-
-            social_account = SocialAccount.objects.create(
-                provider="kakao",
-                provider_user_id=provider_user_id,
-                email=email,
-                profile_image=profile_image,
-                is_active=False,
-            )
-            logger.info(f"New Kakao account created for user: {email}")
-
-        return model_to_dict(social_account)
+        return upsert_social_account(
+            "kakao", provider_user_id, email, profile_image
+        )
 
 
 class NaverLoginCallback(APIView):
@@ -162,7 +169,7 @@ class NaverLoginCallback(APIView):
             "code": code,
         }
         try:
-            response = requests.post(url, params=params)
+            response = get_http_client("naver").post(url, params=params)
             response.raise_for_status()
             return response.json().get("access_token")
         except requests.RequestException as e:
@@ -173,7 +180,7 @@ class NaverLoginCallback(APIView):
         url = "https://openapi.naver.com/v1/nid/me"
         headers = {"Authorization": f"Bearer {access_token}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = get_http_client("naver").get(url, headers=headers)
             response.raise_for_status()
             return response.json().get("response", {})
         except requests.RequestException as e:
@@ -185,23 +192,6 @@ class NaverLoginCallback(APIView):
         profile_image = member_info.get("profile_image")
         provider_user_id = str(member_info.get("id"))
 
-        try:
-            social_account = SocialAccount.objects.get(
-                provider="naver", provider_user_id=provider_user_id
-            )
-            logger.info(f"Existing Naver account found for user: {email}")
-        except SocialAccount.DoesNotExist:
-            if SocialAccount.objects.filter(email=email).exists():
-                logger.warning(f"Account with email {email} already exists")
-                return {"error": "An account with this email already exists."}
-
-            social_account = SocialAccount.objects.create(
-                provider="naver",
-                provider_user_id=provider_user_id,
-                email=email,
-                profile_image=profile_image,
-                is_active=False,
-            )
-            logger.info(f"New Naver account created for user: {email}")
-
-        return model_to_dict(social_account)
+        return upsert_social_account(
+            "naver", provider_user_id, email, profile_image
+        )